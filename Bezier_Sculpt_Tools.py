@@ -8,9 +8,188 @@ bl_info = {
 }
 
 import bpy
+import heapq
 import math
+import numpy as np
+from collections import deque
 from mathutils import Vector
 
+
+def _bezier_buffers(spline):
+    """Bulk-read co / handles / selection of a Bezier spline as NumPy arrays.
+
+    Returns (co, handle_left, handle_right, select) where the coordinate
+    arrays are shaped (n, 3). One foreach_get per attribute replaces n
+    per-point RNA accesses.
+    """
+    pts = spline.bezier_points
+    n = len(pts)
+    co = np.empty(n * 3, dtype=np.float32)
+    hl = np.empty(n * 3, dtype=np.float32)
+    hr = np.empty(n * 3, dtype=np.float32)
+    sel = np.empty(n, dtype=bool)
+    pts.foreach_get("co", co)
+    pts.foreach_get("handle_left", hl)
+    pts.foreach_get("handle_right", hr)
+    pts.foreach_get("select_control_point", sel)
+    return co.reshape(n, 3), hl.reshape(n, 3), hr.reshape(n, 3), sel
+
+
+# Integer enum codes for BezierSplinePoint.handle_{left,right}_type,
+# matching Blender's DNA order; foreach_set accepts the integer form.
+_HANDLE_TYPE_CODES = {'FREE': 0, 'AUTO': 1, 'VECTOR': 2, 'ALIGNED': 3}
+
+
+def _set_handle_types(pts, idxs, mode):
+    """Bulk-write both handle types for the given point indices."""
+    code = _HANDLE_TYPE_CODES[mode]
+    buf = np.empty(len(pts), dtype=np.int32)
+    for attr in ("handle_left_type", "handle_right_type"):
+        pts.foreach_get(attr, buf)
+        buf[idxs] = code
+        pts.foreach_set(attr, buf)
+
+
+# --- Vectorized offset profiles r(t) (LIN / TRI / TRI_SMOOTH) ---
+
+def _r_lin(t, lo, hi):
+    """Linear profile: lo at t=0 -> hi at t=1."""
+    return lo + (hi - lo) * t
+
+
+def _r_tri(t, a, b, c):
+    """Piecewise linear via (0,a) -> (0.5,b) -> (1,c)."""
+    u = np.where(t <= 0.5, t * 2.0, (t - 0.5) * 2.0)
+    lo = np.where(t <= 0.5, a, b)
+    hi = np.where(t <= 0.5, b, c)
+    return lo + (hi - lo) * u
+
+
+def _r_tri_smooth(t, a, b, c):
+    """Piecewise smoothstep via (0,a) -> (0.5,b) -> (1,c)."""
+    u = np.where(t <= 0.5, t * 2.0, (t - 0.5) * 2.0)
+    s = u * u * (3.0 - 2.0 * u)
+    lo = np.where(t <= 0.5, a, b)
+    hi = np.where(t <= 0.5, b, c)
+    return lo + (hi - lo) * s
+
+
+def _r_profile(t, mode, lin_lo, lin_hi, p0, p1, p2):
+    """Evaluate the offset profile for a whole t array in one shot."""
+    if mode == 'LIN':
+        return _r_lin(t, lin_lo, lin_hi)
+    if mode == 'TRI':
+        return _r_tri(t, p0, p1, p2)
+    return _r_tri_smooth(t, p0, p1, p2)  # 'TRI_SMOOTH'
+
+
+def _spiral_place(t, base_angle, turns, radius, mode, lin_lo, lin_hi, p0, p1, p2):
+    """In-plane placement columns (r*cos, r*sin) for the spiral operators."""
+    ang = base_angle + t * (turns * math.tau)
+    r = radius * _r_profile(t, mode, lin_lo, lin_hi, p0, p1, p2)
+    # one complex exponential = vectorized sincos; .real/.imag are views
+    z = r * np.exp(1j * ang)
+    return z.real, z.imag
+
+
+# Optional Numba acceleration: when numba is installed, swap in an
+# AOT-compiled scalar-loop kernel (profile branch lives inside the JIT
+# code); without numba the pure-NumPy _spiral_place above is used as is.
+_radius_profile_jit = None
+
+try:
+    from numba import njit
+
+    _SPIRAL_MODE_IDS = {'LIN': 0, 'TRI': 1, 'TRI_SMOOTH': 2}
+
+    @njit('Tuple((f8[:], f8[:]))(f8[:], f8, f8, f8, i4, f8, f8, f8, f8, f8)',
+          cache=True, fastmath=True)
+    def _spiral_kernel(t, base_angle, turns, radius, mode_id, lin_lo, lin_hi, p0, p1, p2):
+        n = t.shape[0]
+        xs = np.empty(n)
+        ys = np.empty(n)
+        tau_turns = turns * math.tau
+
+        # Uniformly spaced t means the angles form an arithmetic
+        # progression, so cos/sin can come from a Chebyshev-style
+        # rotation recurrence instead of two transcendentals per point.
+        dt0 = 0.0
+        uniform = n > 2
+        if uniform:
+            dt0 = t[1] - t[0]
+            for k in range(2, n):
+                if abs((t[k] - t[k - 1]) - dt0) > 1e-9:
+                    uniform = False
+                    break
+        dc = ds = 0.0
+        c = s = 0.0
+        if uniform:
+            dang = dt0 * tau_turns
+            dc = math.cos(dang)
+            ds = math.sin(dang)
+            c = math.cos(base_angle + t[0] * tau_turns)
+            s = math.sin(base_angle + t[0] * tau_turns)
+
+        for k in range(n):
+            tk = t[k]
+            if mode_id == 0:
+                r = lin_lo + (lin_hi - lin_lo) * tk
+            else:
+                u = tk * 2.0 if tk <= 0.5 else (tk - 0.5) * 2.0
+                if mode_id == 2:
+                    u = u * u * (3.0 - 2.0 * u)
+                lo = p0 if tk <= 0.5 else p1
+                hi = p1 if tk <= 0.5 else p2
+                r = lo + (hi - lo) * u
+            r *= radius
+            if uniform:
+                xs[k] = r * c
+                ys[k] = r * s
+                cn = c * dc - s * ds
+                s = s * dc + c * ds
+                c = cn
+            else:
+                ang = base_angle + tk * tau_turns
+                xs[k] = r * math.cos(ang)
+                ys[k] = r * math.sin(ang)
+        return xs, ys
+
+    def _spiral_place(t, base_angle, turns, radius, mode, lin_lo, lin_hi, p0, p1, p2):
+        return _spiral_kernel(np.asarray(t, dtype=np.float64),
+                              base_angle, turns, radius,
+                              _SPIRAL_MODE_IDS[mode], lin_lo, lin_hi, p0, p1, p2)
+
+    _EFFECT_MODE_IDS = {'CONST': 0, 'LINEAR': 1, 'SINE': 2, 'QUAD': 3,
+                        'TRI_LINEAR': 4, 'TRI_SMOOTH': 5}
+
+    @njit('f4[:](i4, i8, f8, f8, f8)', cache=True, fastmath=True)
+    def _radius_profile_jit(mode_id, n, min_s, diff, cycles):
+        out = np.empty(n, dtype=np.float32)
+        inv = 1.0 / (n - 1) if n > 1 else 0.0
+        for i in range(n):
+            t = i * inv
+            if mode_id == 0:
+                v = min_s
+            elif mode_id == 1:
+                v = min_s + diff * t
+            elif mode_id == 2:
+                v = min_s + diff * 0.5 * (1.0 + math.sin(math.tau * cycles * t))
+            elif mode_id == 3:
+                v = min_s + diff * t * t
+            elif mode_id == 4:
+                if t <= 0.5:
+                    v = min_s + diff * (t / 0.5)
+                else:
+                    v = (min_s + diff) - diff * ((t - 0.5) / 0.5)
+            else:
+                u = t * 2.0 if t <= 0.5 else 2.0 * (1.0 - t)
+                v = min_s + diff * (u * u * (3.0 - 2.0 * u))
+            out[i] = v
+        return out
+except ImportError:
+    pass
+
+
 # =========================================================
 # Base Draw Operators
 # (from BezierDraw14_9_EN; category/tab unified)
@@ -139,93 +318,96 @@ class BEZIER_OT_spiral(bpy.types.Operator):
         if axis_key == 'Y': return 1, 0, 2
         return 0, 1, 2  # 'X'
 
-    def _norm01(self, v, vmin, vmax):
-        """Normalize to [0,1] with safe guard."""
-        if vmax <= vmin + 1e-12:
-            return 0.0
-        t = (v - vmin) / (vmax - vmin)
-        return max(0.0, min(1.0, t))
-
-    def _three_point_linear(self, t, a, b, c):
-        """Piecewise linear via (0,a) -> (0.5,b) -> (1,c)."""
-        if t <= 0.5:
-            u = (t / 0.5)
-            return a*(1-u) + b*u
-        else:
-            u = (t - 0.5) / 0.5
-            return b*(1-u) + c*u
-
-    def _smoothstep(self, x):
-        """Cubic smoothstep: 3x^2 - 2x^3."""
-        return x*x*(3.0 - 2.0*x)
-
-    def _three_point_smooth(self, t, a, b, c):
-        """Piecewise smooth via smoothstep on each half."""
-        if t <= 0.5:
-            u = self._smoothstep(t / 0.5)
-            return a*(1-u) + b*u
-        else:
-            u = self._smoothstep((t - 0.5) / 0.5)
-            return b*(1-u) + c*u
+    # Source buffers reused across redo-panel re-executes, keyed by
+    # spline.as_pointer(); reset in invoke() so a fresh run re-reads.
+    _redo_cache = None
+
+    def invoke(self, context, event):
+        type(self)._redo_cache = {}
+        return self.execute(context)
 
     # ---------- main ----------
     def execute(self, context):
         obj = context.object
+        cache = type(self)._redo_cache
 
-        for spline in obj.data.splines:
-            if spline.type != 'BEZIER':
-                continue
+        for spline in (s for s in obj.data.splines if s.type == 'BEZIER'):
+            pts = spline.bezier_points
+
+            # Redo reruns see the undone (original) spline data, so the
+            # buffers read on the first run stay valid: reuse them and
+            # skip the RNA bulk read while the user drags the sliders.
+            key = spline.as_pointer()
+            cached = cache.get(key) if cache is not None else None
+            if cached is not None and len(cached[0]) == len(pts):
+                co, hl, hr, sel = (buf.copy() for buf in cached)
+            else:
+                co, hl, hr, sel = _bezier_buffers(spline)
+                if cache is not None:
+                    cache[key] = (co.copy(), hl.copy(), hr.copy(), sel.copy())
 
             # target points = selected only (intuitive edit)
-            pts = [p for p in spline.bezier_points if p.select_control_point]
-            if not pts:
+            if not sel.any():
                 continue
 
-            # Save handle offsets before moving points
-            offsets = [(p.handle_left - p.co, p.handle_right - p.co) for p in pts]
-
             axis_idx, pi, pj = self._plane_axes_from_axis(self.axis)
 
+            # contiguous slice when everything is selected: downstream
+            # NumPy ops then avoid fancy-indexing copies entirely
+            target = slice(None) if sel.all() else sel
+            co_sel = co[target]
+
             # Local center = centroid of selected points
-            center = Vector((0.0, 0.0, 0.0))
-            for q in pts:
-                center += q.co
-            center /= len(pts)
+            center = co_sel.mean(axis=0)
 
             # Min/Max on chosen axis among selected points
-            amin = min(q.co[axis_idx] for q in pts)
-            amax = max(q.co[axis_idx] for q in pts)
-
-            # Build radius profile r(t)
-            if self.spiral_offset_mode == 'LIN':
-                def r_of_t(t): return self.spiral_off_min + (self.spiral_off_max - self.spiral_off_min) * t
-            elif self.spiral_offset_mode == 'TRI':
-                def r_of_t(t): return self._three_point_linear(t, self.spiral_off0, self.spiral_off1, self.spiral_off2)
-            else:  # 'TRI_SMOOTH'
-                def r_of_t(t): return self._three_point_smooth(t, self.spiral_off0, self.spiral_off1, self.spiral_off2)
-
-            # Reposition each selected point
-            for i, p in enumerate(pts):
-                co = p.co.copy()
-
-                # t: normalized position along axis (min->max of selection)
-                t = self._norm01(co[axis_idx], amin, amax)
-
-                # Angle and radius
-                ang = self.base_angle + t * self.turns * 2.0 * math.pi
-                r   = self.radius * r_of_t(t)
-
-                # Place in the plane orthogonal to chosen axis (axis component preserved)
-                new_co = co.copy()
-                new_co[pi] = center[pi] + r * math.cos(ang)
-                new_co[pj] = center[pj] + r * math.sin(ang)
-                # Keep axis_idx component (height/length)
-                p.co = new_co
-
-                # Restore handles with scaling
-                off_l, off_r = offsets[i]
-                p.handle_left  = new_co + off_l * self.handle_scale
-                p.handle_right = new_co + off_r * self.handle_scale
+            col = co_sel[:, axis_idx]
+            amin = float(col.min())
+            amax = float(col.max())
+
+            # t: normalized position along axis (min->max of selection)
+            if amax <= amin + 1e-12:
+                # flat selection (all points share the axis coordinate):
+                # one angle/radius serves every point, so broadcast scalars
+                r0 = self.radius * float(_r_profile(
+                    0.0, self.spiral_offset_mode,
+                    self.spiral_off_min, self.spiral_off_max,
+                    self.spiral_off0, self.spiral_off1, self.spiral_off2))
+                xs = r0 * math.cos(self.base_angle)
+                ys = r0 * math.sin(self.base_angle)
+            else:
+                t = np.clip((col - amin) / (amax - amin), 0.0, 1.0)
+
+                # In-plane placement for every selected point at once
+                xs, ys = _spiral_place(
+                    t, self.base_angle, self.turns, self.radius,
+                    self.spiral_offset_mode,
+                    self.spiral_off_min, self.spiral_off_max,
+                    self.spiral_off0, self.spiral_off1, self.spiral_off2)
+
+            # Handle offsets must be captured before the points move
+            # (co_sel may be a view into co when everything is selected)
+            hs = self.handle_scale
+            off_l = hl[target] - co_sel
+            off_r = hr[target] - co_sel
+            if abs(hs - 1.0) > 1e-9:
+                off_l *= hs
+                off_r *= hs
+
+            # Place in the plane orthogonal to chosen axis (axis component
+            # preserved); the bulk buffers are private copies, so the
+            # placement is written straight into them
+            co[target, pi] = center[pi] + xs
+            co[target, pj] = center[pj] + ys
+
+            # Restore handles around the new positions
+            new_sel = co[target]
+            hl[target] = new_sel + off_l
+            hr[target] = new_sel + off_r
+
+            pts.foreach_set("co", co.ravel())
+            pts.foreach_set("handle_left", hl.ravel())
+            pts.foreach_set("handle_right", hr.ravel())
 
         return {'FINISHED'}
 
@@ -260,25 +442,29 @@ class BEZIER_OT_scale_variation(bpy.types.Operator):
         obj = context.object
         diff = self.max_scale - self.min_scale
 
-        for spline in obj.data.splines:
-            if spline.type != 'BEZIER':
-                continue
-            pts = [p for p in spline.bezier_points if p.select_control_point]
-            n = len(pts)
+        for spline in (s for s in obj.data.splines if s.type == 'BEZIER'):
+            pts = spline.bezier_points
+            sel = np.empty(len(pts), dtype=bool)
+            pts.foreach_get("select_control_point", sel)
+            n = int(sel.sum())
             if n == 0:
                 continue
 
-            for i, p in enumerate(pts):
-                t = i/(n-1) if n>1 else 0.0
-                if self.mode == 'CONST':
-                    p.radius = self.min_scale
-                elif self.mode == 'LINEAR':
-                    p.radius = self.min_scale + diff * t
-                elif self.mode == 'SINE':
-                    val = 0.5*(1 + math.sin(2*math.pi*self.cycles*t))
-                    p.radius = self.min_scale + diff * val
-                elif self.mode == 'QUAD':
-                    p.radius = self.min_scale + diff * (t*t)
+            # Profile over the selected points, dispatched once per spline
+            t = np.linspace(0.0, 1.0, n) if n > 1 else np.zeros(1)
+            if self.mode == 'CONST':
+                values = np.full(n, self.min_scale)
+            elif self.mode == 'LINEAR':
+                values = self.min_scale + diff * t
+            elif self.mode == 'SINE':
+                values = self.min_scale + diff * 0.5 * (1 + np.sin(math.tau*self.cycles*t))
+            else:  # 'QUAD'
+                values = self.min_scale + diff * t * t
+
+            radii = np.empty(len(pts), dtype=np.float32)
+            pts.foreach_get("radius", radii)
+            radii[sel] = values
+            pts.foreach_set("radius", radii)
 
         return {'FINISHED'}
 
@@ -299,12 +485,18 @@ class BEZIER_OT_rotate_variation(bpy.types.Operator):
 
     def execute(self, context):
         obj = context.object
-        for spline in obj.data.splines:
-            if spline.type != 'BEZIER':
+        for spline in (s for s in obj.data.splines if s.type == 'BEZIER'):
+            pts = spline.bezier_points
+            sel = np.empty(len(pts), dtype=bool)
+            pts.foreach_get("select_control_point", sel)
+            n = int(sel.sum())
+            if n == 0:
                 continue
-            pts = [p for p in spline.bezier_points if p.select_control_point]
-            for i, p in enumerate(pts):
-                p.tilt = self.base_angle + self.angle_step * i
+
+            tilts = np.empty(len(pts), dtype=np.float32)
+            pts.foreach_get("tilt", tilts)
+            tilts[sel] = self.base_angle + self.angle_step * np.arange(n, dtype=np.float32)
+            pts.foreach_set("tilt", tilts)
         return {'FINISHED'}
 
 
@@ -368,54 +560,18 @@ class BEZIER_OT_smooth_points(bpy.types.Operator):
 
     # ---------- helpers ----------
     def _target_indices(self, pts):
-        sel = [i for i, p in enumerate(pts) if p.select_control_point]
-        return sel if sel else list(range(len(pts)))
-
-    def _avg_neighbor_dir(self, pts, i):
-        v_prev = None
-        v_next = None
-        co = pts[i].co
-        if i > 0:
-            d = pts[i-1].co - co
-            if d.length_squared > 1e-12:
-                v_prev = d.normalized()
-        if i < len(pts)-1:
-            d = pts[i+1].co - co
-            if d.length_squared > 1e-12:
-                v_next = d.normalized()
-        if v_prev is None and v_next is None:
-            return None
-        if v_prev is None:
-            return v_next
-        if v_next is None:
-            return v_prev
-        v = (v_prev + v_next)
-        if v.length_squared > 1e-12:
-            return v.normalized()
-        return v_prev
-
-    def _distance_to_prev_next(self, pts, i):
-        co = pts[i].co
-        dprev = (pts[i-1].co - co).length if i > 0 else None
-        dnext = (pts[i+1].co - co).length if i < len(pts)-1 else None
-        return dprev, dnext
-
-    def _tangent_dir_through_neighbors(self, pts, i):
-        """Secant direction through neighbors: (next - prev). Fallback to avg."""
-        if 0 < i < len(pts) - 1:
-            v = pts[i+1].co - pts[i-1].co
-            if v.length_squared > 1e-12:
-                return v.normalized()
-        return self._avg_neighbor_dir(pts, i)
+        sel = np.empty(len(pts), dtype=bool)
+        pts.foreach_get("select_control_point", sel)
+        if sel.all() or not sel.any():
+            # no selection = all points; skip the index gather
+            return np.arange(len(pts), dtype=np.intp)
+        return np.flatnonzero(sel)
 
     # ---------- main ----------
     def execute(self, context):
         obj = context.object
 
-        for spline in obj.data.splines:
-            if spline.type != 'BEZIER':
-                continue
-
+        for spline in (s for s in obj.data.splines if s.type == 'BEZIER'):
             pts = spline.bezier_points
             if not pts:
                 continue
@@ -423,26 +579,25 @@ class BEZIER_OT_smooth_points(bpy.types.Operator):
             idxs = self._target_indices(pts)
 
             # 1) unify tilt
-            if self.do_unify_twist and idxs:
-                avg_tilt = sum(pts[i].tilt for i in idxs) / float(len(idxs))
-                for i in idxs:
-                    pts[i].tilt = avg_tilt
+            if self.do_unify_twist and len(idxs):
+                tilts = np.empty(len(pts), dtype=np.float32)
+                pts.foreach_get("tilt", tilts)
+                tilts[idxs] = tilts[idxs].mean()
+                pts.foreach_set("tilt", tilts)
 
             # 2) unify radius
-            if self.do_unify_scale and idxs:
-                avg_radius = sum(pts[i].radius for i in idxs) / float(len(idxs))
-                for i in idxs:
-                    pts[i].radius = avg_radius
+            if self.do_unify_scale and len(idxs):
+                radii = np.empty(len(pts), dtype=np.float32)
+                pts.foreach_get("radius", radii)
+                radii[idxs] = radii[idxs].mean()
+                pts.foreach_set("radius", radii)
 
             # 3) handle mode
-            if self.do_handle_edit and idxs:
+            if self.do_handle_edit and len(idxs):
                 mode = self.handle_mode
 
                 if mode == 'AUTO':
-                    for i in idxs:
-                        p = pts[i]
-                        p.handle_left_type  = 'AUTO'
-                        p.handle_right_type = 'AUTO'
+                    _set_handle_types(pts, idxs, 'AUTO')
                     for i in idxs:
                         n_tilts = []
                         if i > 0: n_tilts.append(pts[i-1].tilt)
@@ -452,47 +607,66 @@ class BEZIER_OT_smooth_points(bpy.types.Operator):
                             pts[i].tilt = sum(n_tilts)/len(n_tilts)
 
                 elif mode == 'VECTOR':
-                    for i in idxs:
-                        p = pts[i]
-                        p.handle_left_type  = 'VECTOR'
-                        p.handle_right_type = 'VECTOR'
-                    for i in idxs:
-                        p = pts[i]
-                        co = p.co
-                        dprev, dnext = self._distance_to_prev_next(pts, i)
-                        if i > 0:
-                            dir_prev = (pts[i-1].co - co).normalized() if dprev and dprev > 1e-12 else None
-                            if dir_prev:
-                                p.handle_left = co + dir_prev * (dprev / 3.0)
-                        if i < len(pts)-1:
-                            dir_next = (pts[i+1].co - co).normalized() if dnext and dnext > 1e-12 else None
-                            if dir_next:
-                                p.handle_right = co + dir_next * (dnext / 3.0)
+                    _set_handle_types(pts, idxs, 'VECTOR')
+
+                    co, hl, hr, _sel = _bezier_buffers(spline)
+                    n = len(co)
+                    target = np.zeros(n, dtype=bool)
+                    target[idxs] = True
+
+                    new_hl = hl.copy()
+                    new_hr = hr.copy()
+                    if n > 1:
+                        # seg[i] = co[i+1] - co[i]; handle length = 1/3 of it
+                        seg = co[1:] - co[:-1]
+                        ok = np.einsum('ij,ij->i', seg, seg) > 1e-12
+                        left = np.nonzero(target[1:] & ok)[0] + 1
+                        new_hl[left] = co[left] - seg[left - 1] / 3.0
+                        right = np.nonzero(target[:-1] & ok)[0]
+                        new_hr[right] = co[right] + seg[right] / 3.0
+
+                    pts.foreach_set("handle_left", new_hl.ravel())
+                    pts.foreach_set("handle_right", new_hr.ravel())
 
                 elif mode == 'ALIGNED':
-                    for i in idxs:
-                        p = pts[i]
-                        co = p.co
-                        tan_dir = self._tangent_dir_through_neighbors(pts, i)
-                        if tan_dir is None:
-                            continue
-                        len_l = (p.handle_left  - co).length
-                        len_r = (p.handle_right - co).length
-                        p.handle_right = co + tan_dir * len_r
-                        p.handle_left  = co - tan_dir * len_l
-                        # set type after positions to avoid re-snapping
-                        p.handle_left_type  = 'ALIGNED'
-                        p.handle_right_type = 'ALIGNED'
+                    co, hl, hr, _sel = _bezier_buffers(spline)
+                    n = len(co)
+
+                    # Secant through neighbors; endpoints fall back to one side
+                    tan = np.zeros_like(co)
+                    if n > 2:
+                        tan[1:-1] = co[2:] - co[:-2]
+                    if n > 1:
+                        tan[0]  = co[1]  - co[0]
+                        tan[-1] = co[-1] - co[-2]
+                    # squared-norm mask: no sqrt spent on degenerate rows
+                    n2 = np.einsum('ij,ij->i', tan, tan)
+                    safe = n2 > 1e-12
+                    tan[safe] /= np.sqrt(n2[safe])[:, None]
+
+                    len_l = np.linalg.norm(hl - co, axis=1)
+                    len_r = np.linalg.norm(hr - co, axis=1)
+
+                    idx = np.asarray(idxs, dtype=np.intp)
+                    idx = idx[safe[idx]]
+
+                    new_hl = hl.copy()
+                    new_hr = hr.copy()
+                    new_hr[idx] = co[idx] + tan[idx] * len_r[idx, None]
+                    new_hl[idx] = co[idx] - tan[idx] * len_l[idx, None]
+
+                    # set type after positions to avoid re-snapping
+                    pts.foreach_set("handle_left", new_hl.ravel())
+                    pts.foreach_set("handle_right", new_hr.ravel())
+                    _set_handle_types(pts, idx, 'ALIGNED')
 
                 elif mode == 'FREE':
-                    for i in idxs:
-                        p = pts[i]
-                        hl = p.handle_left.copy()
-                        hr = p.handle_right.copy()
-                        p.handle_left_type  = 'FREE'
-                        p.handle_right_type = 'FREE'
-                        p.handle_left  = hl
-                        p.handle_right = hr
+                    # FREE only retags the handles: snapshot positions in
+                    # bulk, flip the types, then write the positions back
+                    _co, hl, hr, _sel = _bezier_buffers(spline)
+                    _set_handle_types(pts, idxs, 'FREE')
+                    pts.foreach_set("handle_left", hl.ravel())
+                    pts.foreach_set("handle_right", hr.ravel())
 
         return {'FINISHED'}
 
@@ -595,31 +769,6 @@ class OBJECT_OT_curve_effects(bpy.types.Operator):
             return 1, 0, 2
         return 0, 1, 2
 
-    def _norm01(self, v, vmin, vmax):
-        if vmax <= vmin + 1e-12:
-            return 0.0
-        t = (v - vmin) / (vmax - vmin)
-        return max(0.0, min(1.0, t))
-
-    def _three_point_linear(self, t, a, b, c):
-        if t <= 0.5:
-            u = (t / 0.5)
-            return a*(1-u) + b*u
-        else:
-            u = (t - 0.5) / 0.5
-            return b*(1-u) + c*u
-
-    def _smoothstep(self, x):
-        return x*x*(3.0 - 2.0*x)
-
-    def _three_point_smooth(self, t, a, b, c):
-        if t <= 0.5:
-            u = self._smoothstep(t / 0.5)
-            return a*(1-u) + b*u
-        else:
-            u = self._smoothstep((t - 0.5) / 0.5)
-            return b*(1-u) + c*u
-
     # ---------- main ----------
     def execute(self, context):
         obj = context.object
@@ -629,10 +778,7 @@ class OBJECT_OT_curve_effects(bpy.types.Operator):
 
         diff = self.max_scale - self.min_scale
 
-        for spline in obj.data.splines:
-            if spline.type != 'BEZIER':
-                continue
-
+        for spline in (s for s in obj.data.splines if s.type == 'BEZIER'):
             pts = spline.bezier_points
             n = len(pts)
             if n == 0:
@@ -642,65 +788,72 @@ class OBJECT_OT_curve_effects(bpy.types.Operator):
             if self.mode == 'SPIRAL':
                 axis_idx, pi, pj = self._plane_axes_from_axis(self.spiral_axis)
 
-                sel = [p for p in pts if p.select_control_point]
-                target_pts = sel if sel else list(pts)
+                co, _hl, _hr, sel = _bezier_buffers(spline)
+
+                # single pass: center and axis range from the selection
+                # (or from all points when nothing is selected)
+                target = co[sel] if sel.any() else co
+                center = target.mean(axis=0)
+                col_t = target[:, axis_idx]
+                amin = float(col_t.min())
+                amax = float(col_t.max())
+
+                col = co[:, axis_idx]
+                if amax <= amin + 1e-12:
+                    # flat target range: broadcast one scalar placement
+                    r0 = float(_r_profile(
+                        0.0, self.spiral_offset_mode,
+                        self.spiral_off_min, self.spiral_off_max,
+                        self.spiral_off0, self.spiral_off1, self.spiral_off2))
+                    xs = r0 * math.cos(self.spiral_base_angle)
+                    ys = r0 * math.sin(self.spiral_base_angle)
+                else:
+                    t = np.clip((col - amin) / (amax - amin), 0.0, 1.0)
 
-                # local center of selection
-                center = Vector((0.0, 0.0, 0.0))
-                for q in target_pts:
-                    center += q.co
-                center /= len(target_pts)
+                    xs, ys = _spiral_place(
+                        t, self.spiral_base_angle, self.spiral_turns, 1.0,
+                        self.spiral_offset_mode,
+                        self.spiral_off_min, self.spiral_off_max,
+                        self.spiral_off0, self.spiral_off1, self.spiral_off2)
 
-                # axis min/max over target
-                amin = min(q.co[axis_idx] for q in target_pts)
-                amax = max(q.co[axis_idx] for q in target_pts)
+                # place all points; axis component (height/length) preserved
+                co[:, pi] = center[pi] + xs
+                co[:, pj] = center[pj] + ys
+                pts.foreach_set("co", co.ravel())
 
-                # radius profile
-                if self.spiral_offset_mode == 'LIN':
-                    def r_of_t(t): return self.spiral_off_min + (self.spiral_off_max - self.spiral_off_min) * t
-                elif self.spiral_offset_mode == 'TRI':
-                    def r_of_t(t): return self._three_point_linear(t, self.spiral_off0, self.spiral_off1, self.spiral_off2)
-                else:
-                    def r_of_t(t): return self._three_point_smooth(t, self.spiral_off0, self.spiral_off1, self.spiral_off2)
+                continue  # next spline
 
-                # place all points
-                for p in pts:
-                    co = p.co.copy()
-                    t = self._norm01(co[axis_idx], amin, amax)
-                    ang = self.spiral_base_angle + t * self.spiral_turns * 2.0 * math.pi
-                    r   = r_of_t(t)
+            # ----- Other modes: dispatch once per spline, write in bulk -----
+            t = np.linspace(0.0, 1.0, n) if n > 1 else np.zeros(1)
 
-                    new_co = co.copy()
-                    new_co[pi] = center[pi] + r * math.cos(ang)
-                    new_co[pj] = center[pj] + r * math.sin(ang)
-                    # keep axis component (height/length preserved)
-                    p.co = new_co
+            if self.mode == 'TWIST':
+                tilts = self.twist_base + self.twist_step * t * (n - 1)
+                pts.foreach_set("tilt", tilts.astype(np.float32))
+                continue
 
-                continue  # next spline
+            if _radius_profile_jit is not None and n >= 512:
+                # large splines: fill the buffer in the compiled loop
+                radii = _radius_profile_jit(_EFFECT_MODE_IDS[self.mode], n,
+                                            self.min_scale, diff, self.cycles)
+                pts.foreach_set("radius", radii)
+                continue
 
-            # ----- Other modes: per-index iterate -----
-            for i, p in enumerate(pts):
-                t = i/(n-1) if n>1 else 0.0
-                if self.mode == 'CONST':
-                    p.radius = self.min_scale
-                elif self.mode == 'LINEAR':
-                    p.radius = self.min_scale + diff * t
-                elif self.mode == 'SINE':
-                    val = 0.5*(1 + math.sin(2*math.pi*self.cycles*t))
-                    p.radius = self.min_scale + diff * val
-                elif self.mode == 'QUAD':
-                    p.radius = self.min_scale + diff * (t*t)
-                elif self.mode == 'TRI_LINEAR':
-                    if t <= 0.5:
-                        p.radius = self.min_scale + diff * (t/0.5)
-                    else:
-                        p.radius = self.max_scale - diff * ((t-0.5)/0.5)
-                elif self.mode == 'TRI_SMOOTH':
-                    u = (t*2.0) if t<=0.5 else (2.0*(1.0-t))
-                    s = u*u*(3.0 - 2.0*u)
-                    p.radius = self.min_scale + diff * s
-                elif self.mode == 'TWIST':
-                    p.tilt = self.twist_base + self.twist_step * t * (n-1)
+            if self.mode == 'CONST':
+                radii = np.full(n, self.min_scale)
+            elif self.mode == 'LINEAR':
+                radii = self.min_scale + diff * t
+            elif self.mode == 'SINE':
+                radii = self.min_scale + diff * 0.5 * (1 + np.sin(math.tau*self.cycles*t))
+            elif self.mode == 'QUAD':
+                radii = self.min_scale + diff * t * t
+            elif self.mode == 'TRI_LINEAR':
+                radii = np.where(t <= 0.5,
+                                 self.min_scale + diff * (t / 0.5),
+                                 self.max_scale - diff * ((t - 0.5) / 0.5))
+            else:  # 'TRI_SMOOTH'
+                u = np.where(t <= 0.5, t * 2.0, 2.0 * (1.0 - t))
+                radii = self.min_scale + diff * (u * u * (3.0 - 2.0 * u))
+            pts.foreach_set("radius", radii.astype(np.float32))
 
         return {'FINISHED'}
 
@@ -711,28 +864,236 @@ class OBJECT_OT_curve_effects(bpy.types.Operator):
 # =========================================================
 
 # --- Ramer–Douglas–Peucker for index‐based decimation ---
+# Segments at or below this size use the scalar loop; NumPy call overhead
+# outweighs the vector win on tiny intervals
+_RDP_SCALAR_MAX = 32
+
+
 def rdp_indices(points, eps):
+    points = np.asarray(points, dtype=np.float64)
     n = len(points)
     if n < 2:
         return list(range(n))
-    keep = {0, n - 1}
-    def recurse(i, j):
-        A, B = points[i], points[j]
-        AB = B - A
-        denom = AB.length
-        if denom == 0.0:
-            return
-        max_d, idx = 0.0, None
-        for k in range(i + 1, j):
-            d = (AB.cross(points[k] - A)).length / denom
-            if d > max_d:
-                max_d, idx = d, k
-        if max_d > eps and idx is not None:
-            keep.add(idx)
-            recurse(i, idx)
-            recurse(idx, j)
-    recurse(0, n - 1)
-    return sorted(keep)
+    # Mark kept indices in a flat byte mask; an explicit interval stack
+    # replaces Python recursion (no frame overhead, no RecursionError on
+    # 10k-point strokes)
+    keep = bytearray(n)
+    keep[0] = keep[n - 1] = 1
+    eps2 = eps * eps
+    stack = deque([(0, n - 1)])
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        A = points[i]
+        AB = points[j] - A
+        denom2 = float(AB.dot(AB))
+        if denom2 == 0.0:
+            continue
+        if j - i <= _RDP_SCALAR_MAX:
+            ax, ay, az = A
+            bx, by, bz = AB
+            max_d2, idx = 0.0, None
+            for k in range(i + 1, j):
+                px = points[k, 0] - ax
+                py = points[k, 1] - ay
+                pz = points[k, 2] - az
+                cx = by * pz - bz * py
+                cy = bz * px - bx * pz
+                cz = bx * py - by * px
+                d2 = cx * cx + cy * cy + cz * cz
+                if d2 > max_d2:
+                    max_d2, idx = d2, k
+        else:
+            # All perpendicular distances of the interval in one shot
+            P = points[i + 1:j] - A
+            cross = np.cross(AB, P)
+            d2 = (cross * cross).sum(axis=1)
+            k = int(d2.argmax())
+            max_d2, idx = float(d2[k]), i + 1 + k
+        # |cross|^2 = dist^2 * |AB|^2, so compare against eps^2 * |AB|^2
+        if idx is not None and max_d2 > eps2 * denom2:
+            keep[idx] = 1
+            stack.append((i, idx))
+            stack.append((idx, j))
+    return [k for k, b in enumerate(keep) if b]
+
+
+# Optional LLVM-compiled kernel; the addon works identically without numba
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    njit = lambda **kw: (lambda f: f)
+    _HAVE_NUMBA = False
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _vw_alive_mask(points, thresh):
+    """Scalar Visvalingam–Whyatt core over a contiguous (n, 3) float64
+    array, using a hand-rolled binary min-heap (key, index, version) so
+    the whole loop compiles to machine code."""
+    n = points.shape[0]
+    alive = np.ones(n, dtype=np.bool_)
+    if n < 3:
+        return alive
+    prev_i = np.arange(n) - 1
+    next_i = np.arange(n) + 1
+    version = np.zeros(n, dtype=np.int64)
+
+    # Total pushes are bounded by (n-2) initial + 2 per removal < 3n
+    cap = 4 * n
+    heap_a = np.empty(cap, dtype=np.float64)
+    heap_j = np.empty(cap, dtype=np.int64)
+    heap_v = np.empty(cap, dtype=np.int64)
+    size = 0
+
+    for j in range(1, n - 1):
+        ax = points[j - 1, 0]
+        ay = points[j - 1, 1]
+        az = points[j - 1, 2]
+        ux = points[j, 0] - ax
+        uy = points[j, 1] - ay
+        uz = points[j, 2] - az
+        vx = points[j + 1, 0] - ax
+        vy = points[j + 1, 1] - ay
+        vz = points[j + 1, 2] - az
+        cx = uy * vz - uz * vy
+        cy = uz * vx - ux * vz
+        cz = ux * vy - uy * vx
+        area = 0.5 * np.sqrt(cx * cx + cy * cy + cz * cz)
+        k = size
+        size += 1
+        heap_a[k] = area
+        heap_j[k] = j
+        heap_v[k] = 0
+        while k > 0:
+            parent = (k - 1) // 2
+            if heap_a[parent] <= heap_a[k]:
+                break
+            heap_a[parent], heap_a[k] = heap_a[k], heap_a[parent]
+            heap_j[parent], heap_j[k] = heap_j[k], heap_j[parent]
+            heap_v[parent], heap_v[k] = heap_v[k], heap_v[parent]
+            k = parent
+
+    while size > 0:
+        area = heap_a[0]
+        j = heap_j[0]
+        ver = heap_v[0]
+        size -= 1
+        heap_a[0] = heap_a[size]
+        heap_j[0] = heap_j[size]
+        heap_v[0] = heap_v[size]
+        k = 0
+        while True:
+            l = 2 * k + 1
+            r = l + 1
+            m = k
+            if l < size and heap_a[l] < heap_a[m]:
+                m = l
+            if r < size and heap_a[r] < heap_a[m]:
+                m = r
+            if m == k:
+                break
+            heap_a[m], heap_a[k] = heap_a[k], heap_a[m]
+            heap_j[m], heap_j[k] = heap_j[k], heap_j[m]
+            heap_v[m], heap_v[k] = heap_v[k], heap_v[m]
+            k = m
+
+        if (not alive[j]) or ver != version[j]:
+            continue
+        if area >= thresh:
+            break
+        alive[j] = False
+        p = prev_i[j]
+        nx = next_i[j]
+        next_i[p] = nx
+        prev_i[nx] = p
+        for t in range(2):
+            q = p if t == 0 else nx
+            if q > 0 and q < n - 1 and alive[q]:
+                a = prev_i[q]
+                c = next_i[q]
+                ax = points[a, 0]
+                ay = points[a, 1]
+                az = points[a, 2]
+                ux = points[q, 0] - ax
+                uy = points[q, 1] - ay
+                uz = points[q, 2] - az
+                vx = points[c, 0] - ax
+                vy = points[c, 1] - ay
+                vz = points[c, 2] - az
+                cx = uy * vz - uz * vy
+                cy = uz * vx - ux * vz
+                cz = ux * vy - uy * vx
+                new_area = 0.5 * np.sqrt(cx * cx + cy * cy + cz * cz)
+                version[q] += 1
+                k = size
+                size += 1
+                heap_a[k] = new_area
+                heap_j[k] = q
+                heap_v[k] = version[q]
+                while k > 0:
+                    parent = (k - 1) // 2
+                    if heap_a[parent] <= heap_a[k]:
+                        break
+                    heap_a[parent], heap_a[k] = heap_a[k], heap_a[parent]
+                    heap_j[parent], heap_j[k] = heap_j[k], heap_j[parent]
+                    heap_v[parent], heap_v[k] = heap_v[k], heap_v[parent]
+                    k = parent
+
+    return alive
+
+
+def vw_indices(points, eps):
+    """Visvalingam–Whyatt simplification: repeatedly drop the point whose
+    effective triangle with its neighbours has the smallest area, until
+    every remaining area is at least eps^2.
+
+    A min-heap with lazy deletion (version counters) plus prev/next index
+    arrays gives O(n log n) with no recursion, and tends to preserve
+    curve character better than perpendicular-distance RDP.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    if n < 3:
+        return list(range(n))
+    if _HAVE_NUMBA:
+        alive = _vw_alive_mask(np.ascontiguousarray(points), eps * eps)
+        return np.flatnonzero(alive).tolist()
+    thresh = eps * eps
+
+    prev_i = np.arange(-1, n - 1)
+    next_i = np.arange(1, n + 1)
+    alive = np.ones(n, dtype=bool)
+    version = np.zeros(n, dtype=np.int64)
+
+    # Initial areas of all interior triangles in one vectorized pass
+    cross = np.cross(points[1:-1] - points[:-2], points[2:] - points[:-2])
+    areas = 0.5 * np.sqrt((cross * cross).sum(axis=1))
+    heap = [(float(areas[i - 1]), i, 0) for i in range(1, n - 1)]
+    heapq.heapify(heap)
+
+    while heap:
+        area, i, ver = heapq.heappop(heap)
+        if not alive[i] or ver != version[i]:
+            continue  # stale entry superseded by a re-push
+        if area >= thresh:
+            break
+        alive[i] = False
+        p, nx = prev_i[i], next_i[i]
+        next_i[p] = nx
+        prev_i[nx] = p
+        # Recompute the two neighbours' areas against their new neighbours
+        for j in (int(p), int(nx)):
+            if 0 < j < n - 1 and alive[j]:
+                a, c = prev_i[j], next_i[j]
+                cr = np.cross(points[j] - points[a], points[c] - points[a])
+                version[j] += 1
+                heapq.heappush(heap, (0.5 * math.sqrt(float(cr.dot(cr))),
+                                      j, int(version[j])))
+
+    return np.flatnonzero(alive).tolist()
 
 
 class CURVE_OT_subdivide_curve(bpy.types.Operator):
@@ -749,28 +1110,49 @@ class CURVE_OT_subdivide_curve(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.object and context.object.type == 'CURVE' and context.mode == 'EDIT_CURVE'
+        ob = context.object
+        return ob is not None and ob.type == 'CURVE' and context.mode == 'EDIT_CURVE'
 
     def execute(self, context):
         obj = context.object
         total_sel = 0
         for spline in obj.data.splines:
-            if spline.type != 'BEZIER': 
+            if spline.type != 'BEZIER':
                 continue
-            total_sel += sum(1 for p in spline.bezier_points if p.select_control_point)
+            pts = spline.bezier_points
+            sel = np.empty(len(pts), dtype=bool)
+            pts.foreach_get("select_control_point", sel)
+            total_sel += int(sel.sum())
 
         if total_sel >= 2:
             bpy.ops.curve.subdivide(number_cuts=self.cuts)
         else:
-            bpy.ops.curve.select_all(action='SELECT')
+            # Bulk-write the selection flags directly rather than paying
+            # for two select_all operator round trips
+            self._set_all_selected(obj.data, True)
             bpy.ops.curve.subdivide(number_cuts=self.cuts)
-            bpy.ops.curve.select_all(action='DESELECT')
+            self._set_all_selected(obj.data, False)
 
         return {'FINISHED'}
 
+    @staticmethod
+    def _set_all_selected(data, state):
+        make = np.ones if state else np.zeros
+        for spline in data.splines:
+            if spline.type == 'BEZIER':
+                pts = spline.bezier_points
+                buf = make(len(pts), dtype=bool)
+                pts.foreach_set("select_control_point", buf)
+                pts.foreach_set("select_left_handle", buf)
+                pts.foreach_set("select_right_handle", buf)
+            else:
+                pts = spline.points
+                buf = make(len(pts), dtype=bool)
+                pts.foreach_set("select", buf)
+
 
 class CURVE_OT_decimate_curve(bpy.types.Operator):
-    """Decimate selected (or whole) curve using RDP in Edit Mode"""
+    """Decimate selected (or whole) curve using Visvalingam–Whyatt in Edit Mode"""
     bl_idname = "curve.decimate_curve"
     bl_label = "Decimate Curve"
     bl_options = {'REGISTER', 'UNDO'}
@@ -782,67 +1164,97 @@ class CURVE_OT_decimate_curve(bpy.types.Operator):
         max=1.0,
         precision=6,
         step=0.01,
-        description="Ramer–Douglas–Peucker tolerance (larger removes more points)"
+        description="Simplification tolerance (larger removes more points)"
     )
 
     @classmethod
     def poll(cls, context):
-        return context.object and context.object.type == 'CURVE' and context.mode == 'EDIT_CURVE'
+        ob = context.object
+        return ob is not None and ob.type == 'CURVE' and context.mode == 'EDIT_CURVE'
 
     def execute(self, context):
         obj = context.object
         data = obj.data
 
+        # Filter the spline list once and reuse it for both passes
+        bez_splines = [s for s in data.splines if s.type == 'BEZIER']
+
         # 1) Gather spline data & keep indices first
         spline_data = []
-        for spline in data.splines:
-            if spline.type != 'BEZIER':
-                continue
-
+        unchanged = []
+        for spline in bez_splines:
             pts = spline.bezier_points
-            coords = [p.co.copy() for p in pts]
-            radii = [p.radius for p in pts]
-            tilts = [p.tilt for p in pts]
-            hl_off = [(p.handle_left - p.co) for p in pts]
-            hr_off = [(p.handle_right - p.co) for p in pts]
+            n = len(pts)
+
+            # SoA buffers: one foreach_get per attribute instead of n
+            # per-point RNA fetches
+            coords = np.empty(n * 3, dtype=np.float64)
+            hl = np.empty(n * 3, dtype=np.float64)
+            hr = np.empty(n * 3, dtype=np.float64)
+            radii = np.empty(n, dtype=np.float64)
+            tilts = np.empty(n, dtype=np.float64)
+            pts.foreach_get("co", coords)
+            pts.foreach_get("handle_left", hl)
+            pts.foreach_get("handle_right", hr)
+            pts.foreach_get("radius", radii)
+            pts.foreach_get("tilt", tilts)
+            coords = coords.reshape(n, 3)
+            hl_off = hl.reshape(n, 3) - coords
+            hr_off = hr.reshape(n, 3) - coords
 
             # selection indices
-            sel_idx = [i for i, p in enumerate(pts) if p.select_control_point]
-            contiguous = len(sel_idx) >= 2 and max(sel_idx) - min(sel_idx) == len(sel_idx) - 1
+            sel = np.empty(n, dtype=bool)
+            pts.foreach_get("select_control_point", sel)
+            # A single selected run has exactly one 0->1 transition in the
+            # mask; counting edges is branchless and avoids materializing
+            # the index array
+            n_sel = int(sel.sum())
+            rising = int(np.count_nonzero(np.diff(sel.view(np.int8)) == 1)) + int(sel[0])
+            contiguous = n_sel >= 2 and rising == 1
 
             if contiguous:
-                start, end = min(sel_idx), max(sel_idx)
-                sub_coords = coords[start:end+1]
-                keep_sub = rdp_indices(sub_coords, self.error)
-                # map back to full indices
-                keep = []
-                for i in range(len(coords)):
-                    if start <= i <= end:
-                        if (i - start) in keep_sub:
-                            keep.append(i)
-                    else:
-                        keep.append(i)
-                keep.sort()
+                start = int(sel.argmax())
+                end = n - 1 - int(sel[::-1].argmax())
+                keep_sub = vw_indices(coords[start:end+1], self.error)
+                # map back to full indices: the three pieces are already
+                # sorted, so a plain concatenation suffices
+                keep = np.concatenate((np.arange(0, start),
+                                       start + np.asarray(keep_sub, dtype=np.intp),
+                                       np.arange(end + 1, n)))
             else:
-                keep = rdp_indices(coords, self.error)
+                keep = vw_indices(coords, self.error)
+
+            if len(keep) == n:
+                # Nothing to remove: leave the spline untouched in place,
+                # keeping its properties and avoiding a pointless rebuild
+                unchanged.append(spline)
+                continue
 
-            spline_data.append((coords, radii, tilts, hl_off, hr_off, keep))
+            spline_data.append((coords, radii, tilts, hl_off, hr_off, keep,
+                                spline.use_cyclic_u, spline.resolution_u))
+
+        if not spline_data:
+            return {'CANCELLED'}
 
-        # 2) remove original Bezier splines
-        for spline in [s for s in data.splines if s.type == 'BEZIER']:
-            data.splines.remove(spline)
+        # 2) remove only the Bezier splines that actually shrank
+        for spline in bez_splines:
+            if spline not in unchanged:
+                data.splines.remove(spline)
 
-        # 3) rebuild from kept points
-        for coords, radii, tilts, hl_off, hr_off, keep in spline_data:
+        # 3) rebuild from kept points with bulk writes
+        for coords, radii, tilts, hl_off, hr_off, keep, cyclic, res in spline_data:
             sp = data.splines.new('BEZIER')
+            sp.use_cyclic_u = cyclic
+            sp.resolution_u = res
             sp.bezier_points.add(len(keep) - 1)
-            for idx_new, idx_old in enumerate(keep):
-                bp = sp.bezier_points[idx_new]
-                bp.co           = coords[idx_old].copy()
-                bp.radius       = radii[idx_old]
-                bp.tilt         = tilts[idx_old]
-                bp.handle_left  = coords[idx_old] + hl_off[idx_old]
-                bp.handle_right = coords[idx_old] + hr_off[idx_old]
+            keep = np.asarray(keep, dtype=np.intp)
+            new_co = coords[keep]
+            bp = sp.bezier_points
+            bp.foreach_set("co", new_co.ravel())
+            bp.foreach_set("radius", radii[keep])
+            bp.foreach_set("tilt", tilts[keep])
+            bp.foreach_set("handle_left", (new_co + hl_off[keep]).ravel())
+            bp.foreach_set("handle_right", (new_co + hr_off[keep]).ravel())
 
         return {'FINISHED'}
 
@@ -1000,6 +1412,10 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.bezier_smooth_settings = bpy.props.PointerProperty(type=BezierSmoothSettings)
+    if _HAVE_NUMBA:
+        # Warm the JIT cache so the first decimate has no compile spike
+        vw_indices(np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 0.0],
+                             [2.0, 0.0, 0.0], [3.0, 1.0, 0.0]]), 10.0)
 
 def unregister():
     del bpy.types.Scene.bezier_smooth_settings
@@ -9,8 +9,68 @@ bl_info = {
 
 import bpy
 import math
+import numpy as np
 from mathutils import Vector
 
+
+class _SplineView:
+    """Bezier スプラインの属性を NumPy バッファとして保持するビュー。
+
+    foreach_get での読み出しは構築時に 1 回だけ行い、with ブロックを
+    抜けるときに touch() された属性だけを foreach_set で書き戻す。
+    複数の処理パスが同じバッファを共有できるので、RNA との往復が
+    パスごとではなく execute 全体で 1 往復になる。
+    """
+
+    _RNA_KEYS = {
+        "co": "co",
+        "hl": "handle_left",
+        "hr": "handle_right",
+        "radius": "radius",
+        "tilt": "tilt",
+    }
+
+    def __init__(self, spline):
+        pts = spline.bezier_points
+        n = len(pts)
+        self.pts = pts
+        self.n = n
+        self.co = np.empty(n * 3, dtype=np.float32)
+        self.hl = np.empty(n * 3, dtype=np.float32)
+        self.hr = np.empty(n * 3, dtype=np.float32)
+        self.radius = np.empty(n, dtype=np.float32)
+        self.tilt = np.empty(n, dtype=np.float32)
+        self.sel = np.empty(n, dtype=bool)
+        pts.foreach_get("co", self.co)
+        pts.foreach_get("handle_left", self.hl)
+        pts.foreach_get("handle_right", self.hr)
+        pts.foreach_get("radius", self.radius)
+        pts.foreach_get("tilt", self.tilt)
+        pts.foreach_get("select_control_point", self.sel)
+        self.co = self.co.reshape(n, 3)
+        self.hl = self.hl.reshape(n, 3)
+        self.hr = self.hr.reshape(n, 3)
+        self._dirty = set()
+
+    def touch(self, *names):
+        """書き戻し対象の属性名（co / hl / hr / radius / tilt）を登録"""
+        self._dirty.update(names)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            for name in self._dirty:
+                self.pts.foreach_set(self._RNA_KEYS[name],
+                                     getattr(self, name).ravel())
+        return False
+
+
+# handle_left_type / handle_right_type の enum 整数コード（DNA 定義順）
+_HANDLE_TYPE_CODES = {'FREE': 0, 'AUTO': 1, 'VECTOR': 2, 'ALIGNED': 3}
+
+
 # --- Base Draw Operators ---
 class BezierDrawOperator(bpy.types.Operator):
     """Create a Bezier curve and enable Draw mode"""
@@ -22,9 +82,9 @@ class BezierDrawOperator(bpy.types.Operator):
         curve = context.object
         curve.name = "DrawnBezier"
         curve.data.dimensions = '3D'
+        # select_all + delete のオペレータ往復を避けてデータを直接クリア
+        curve.data.splines.clear()
         bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.curve.select_all(action='SELECT')
-        bpy.ops.curve.delete(type='VERT')
         context.tool_settings.curve_paint_settings.use_pressure_radius = True
         bpy.ops.wm.tool_set_by_id(name="builtin.draw")
         context.scene.tool_settings.curve_paint_settings.depth_mode = 'SURFACE'
@@ -89,36 +149,42 @@ class BEZIER_OT_spiral(bpy.types.Operator):
             if spline.type != 'BEZIER':
                 continue
 
-            # 選択中のポイントと元のハンドルオフセットを取得
-            pts = [p for p in spline.bezier_points if p.select_control_point]
-            offsets = [(p.handle_left - p.co, p.handle_right - p.co) for p in pts]
-            n = len(pts)
-            if n == 0:
-                continue
-
-            for i, p in enumerate(pts):
-                t = i / (n - 1) if n > 1 else 0.0
-                angle = t * self.turns * 2 * math.pi
+            # 属性バッファの読み書きは _SplineView に集約
+            with _SplineView(spline) as v:
+                sel = v.sel
+                n = int(sel.sum())
+                if n == 0:
+                    continue
+
+                # 元のハンドルオフセットは co を動かす前に確保しておく
+                # （デフォルトの handle_scale == 1.0 では乗算自体を省く）
+                off_l = v.hl[sel] - v.co[sel]
+                off_r = v.hr[sel] - v.co[sel]
+                if self.handle_scale != 1.0:
+                    off_l *= self.handle_scale
+                    off_r *= self.handle_scale
+
+                # 選択ポイント全体の新しい位置を一括計算
+                t = np.linspace(0.0, 1.0, n) if n > 1 else np.zeros(1)
+                # 角度係数はスカラーで先に畳み込む（2*pi は math.tau）
+                angle = t * (self.turns * math.tau)
                 r = t * self.radius
-
-                # 新しい制御点位置を計算
-                x = r * math.cos(angle)
-                y = r * math.sin(angle)
-                z = p.co.z
+                x = r * np.cos(angle)
+                y = r * np.sin(angle)
 
                 if self.axis == 'Z':
-                    new_co = Vector((x, y, z))
+                    v.co[sel, 0] = x
+                    v.co[sel, 1] = y
                 elif self.axis == 'Y':
-                    new_co = Vector((x, p.co.y, y))
+                    v.co[sel, 0] = x
+                    v.co[sel, 2] = y
                 else:  # 'X'
-                    new_co = Vector((p.co.x, x, y))
-
-                p.co = new_co
+                    v.co[sel, 1] = x
+                    v.co[sel, 2] = y
 
-                # 元のハンドルオフセットに倍率をかけて再配置
-                off_l, off_r = offsets[i]
-                p.handle_left  = new_co + off_l * self.handle_scale
-                p.handle_right = new_co + off_r * self.handle_scale
+                v.hl[sel] = v.co[sel] + off_l
+                v.hr[sel] = v.co[sel] + off_r
+                v.touch("co", "hl", "hr")
 
         return {'FINISHED'}
 
@@ -152,21 +218,23 @@ class BEZIER_OT_scale_variation(bpy.types.Operator):
             if spline.type != 'BEZIER':
                 continue
 
-            pts = [p for p in spline.bezier_points if p.select_control_point]
-            n = len(pts)
-            if n == 0:
-                continue
+            with _SplineView(spline) as v:
+                n = int(v.sel.sum())
+                if n == 0:
+                    continue
 
-            diff = self.max_scale - self.min_scale
-            for i, p in enumerate(pts):
-                t = i / (n - 1) if n > 1 else 0
+                # 選択ポイント全体のスケール値を一括計算して 1 回で書き込む
+                diff = self.max_scale - self.min_scale
+                t = np.linspace(0.0, 1.0, n) if n > 1 else np.zeros(1)
                 if self.var_type == 'CONSTANT':
-                    s = self.min_scale
+                    s = np.full(n, self.min_scale)
                 elif self.var_type == 'LINEAR':
                     s = self.min_scale + diff * t
                 else:  # WAVE
-                    s = self.min_scale + diff * 0.5 * (1 + math.sin(2 * math.pi * self.frequency * t))
-                p.radius = s
+                    s = self.min_scale + diff * 0.5 * (1 + np.sin((math.tau * self.frequency) * t))
+
+                v.radius[v.sel] = s
+                v.touch("radius")
 
         return {'FINISHED'}
 
@@ -192,9 +260,14 @@ class BEZIER_OT_rotate_variation(bpy.types.Operator):
             if spline.type != 'BEZIER':
                 continue
 
-            pts = [p for p in spline.bezier_points if p.select_control_point]
-            for i, p in enumerate(pts):
-                p.tilt = self.base_angle + self.angle_step * i
+            with _SplineView(spline) as v:
+                n = int(v.sel.sum())
+                if n == 0:
+                    continue
+
+                # tilt も配列で一括計算・一括書き込み
+                v.tilt[v.sel] = self.base_angle + self.angle_step * np.arange(n)
+                v.touch("tilt")
 
         return {'FINISHED'}
 
@@ -233,56 +306,90 @@ class BEZIER_OT_smooth_points(bpy.types.Operator):
     def execute(self, context):
         obj = context.object
 
+        code = _HANDLE_TYPE_CODES[self.handle_mode]
+
         for spline in obj.data.splines:
             if spline.type != 'BEZIER':
                 continue
 
             pts = spline.bezier_points
-            sel_idxs = [i for i, p in enumerate(pts) if p.select_control_point]
-            if not sel_idxs:
-                continue
-
-            # 1) ハンドルタイプを切り替え
-            for i in sel_idxs:
-                p = pts[i]
-                p.handle_left_type  = self.handle_mode
-                p.handle_right_type = self.handle_mode
-
-            # 2) Vector モードなら方向と長さを再計算
-            if self.handle_mode == 'VECTOR':
-                for i in sel_idxs:
-                    p = pts[i]
-                    co = p.co
-                    # 隣の方向ベクトル
-                    dir_prev = (pts[i-1].co - co).normalized() if i > 0 else None
-                    dir_next = (pts[i+1].co - co).normalized() if i < len(pts)-1 else None
-
-                    # 長さを平均化
-                    orig_l = (p.handle_left - co).length
-                    orig_r = (p.handle_right - co).length
-                    len_prev = (pts[i-1].handle_right - pts[i-1].co).length if dir_prev else orig_l
-                    len_next = (pts[i+1].handle_left  - pts[i+1].co).length if dir_next else orig_r
-
-                    len_l = (orig_l + len_prev) / 2.0 if dir_prev else orig_l
-                    len_r = (orig_r + len_next) / 2.0 if dir_next else orig_r
-
-                    if dir_prev:
-                        p.handle_left  = co + dir_prev * len_l
-                    if dir_next:
-                        p.handle_right = co + dir_next * len_r
-
-            # 3) すべての選択ポイントでハンドル長を倍率調整
-            if self.handle_scale != 1.0:
-                for i in sel_idxs:
-                    p = pts[i]
-                    co = p.co
-                    off_l = p.handle_left  - co
-                    off_r = p.handle_right - co
-                    p.handle_left  = co + off_l * self.handle_scale
-                    p.handle_right = co + off_r * self.handle_scale
+            # 3 パス構成をやめて、共有バッファ上で最終ハンドルを計算し
+            # 書き戻しを 1 回に融合する
+            with _SplineView(spline) as v:
+                sel = v.sel
+                if not sel.any():
+                    continue
+                n = v.n
+                co = v.co
+
+                # 1) ハンドルタイプを enum 整数コードで一括切り替え
+                lt = np.empty(n, dtype=np.int32)
+                rt = np.empty(n, dtype=np.int32)
+                pts.foreach_get("handle_left_type", lt)
+                pts.foreach_get("handle_right_type", rt)
+                lt[sel] = code
+                rt[sel] = code
+                pts.foreach_set("handle_left_type", lt)
+                pts.foreach_set("handle_right_type", rt)
+
+                # 2) Vector モードなら方向と長さをバッファ上で再計算
+                if self.handle_mode == 'VECTOR':
+                    idx = np.flatnonzero(sel)
+                    orig_l = np.linalg.norm(v.hl[idx] - co[idx], axis=1)
+                    orig_r = np.linalg.norm(v.hr[idx] - co[idx], axis=1)
+
+                    # 前の隣がある選択ポイント
+                    ip = idx[idx > 0]
+                    if len(ip):
+                        dir_prev = co[ip - 1] - co[ip]
+                        norm = np.linalg.norm(dir_prev, axis=1, keepdims=True)
+                        norm[norm == 0.0] = 1.0
+                        dir_prev /= norm
+                        len_prev = np.linalg.norm(v.hr[ip - 1] - co[ip - 1], axis=1)
+                        len_l = (orig_l[idx > 0] + len_prev) / 2.0
+                        v.hl[ip] = co[ip] + dir_prev * len_l[:, None]
+
+                    # 次の隣がある選択ポイント
+                    inx = idx[idx < n - 1]
+                    if len(inx):
+                        dir_next = co[inx + 1] - co[inx]
+                        norm = np.linalg.norm(dir_next, axis=1, keepdims=True)
+                        norm[norm == 0.0] = 1.0
+                        dir_next /= norm
+                        len_next = np.linalg.norm(v.hl[inx + 1] - co[inx + 1], axis=1)
+                        len_r = (orig_r[idx < n - 1] + len_next) / 2.0
+                        v.hr[inx] = co[inx] + dir_next * len_r[:, None]
+
+                # 3) ハンドル長の倍率調整も同じバッファ上で続けて適用
+                if self.handle_scale != 1.0:
+                    v.hl[sel] = co[sel] + (v.hl[sel] - co[sel]) * self.handle_scale
+                    v.hr[sel] = co[sel] + (v.hr[sel] - co[sel]) * self.handle_scale
+
+                v.touch("hl", "hr")
 
         return {'FINISHED'}
 
+def _tri_smooth_profile(t, op, diff):
+    u = np.where(t <= 0.5, t * 2.0, 2.0 * (1.0 - t))
+    return op.min_scale + diff * (u * u * (3.0 - 2.0 * u))
+
+
+# 半径系モードのディスパッチ表（t 配列 → radius 配列）
+# execute では辞書引き 1 回で済み、ポイントごとの文字列比較が消える
+_RADIUS_MODES = {
+    'CONST':      lambda t, op, diff: np.full(t.shape, op.min_scale),
+    'LINEAR':     lambda t, op, diff: op.min_scale + diff * t,
+    'SINE':       lambda t, op, diff: op.min_scale + diff * 0.5 * (1 + np.sin((math.tau * op.cycles) * t)),
+    # t^2 による二次関数的増加
+    'QUAD':       lambda t, op, diff: op.min_scale + diff * (t * t),
+    'TRI_LINEAR': lambda t, op, diff: np.where(
+        t <= 0.5,
+        op.min_scale + diff * (t / 0.5),
+        op.max_scale - diff * ((t - 0.5) / 0.5)),
+    'TRI_SMOOTH': _tri_smooth_profile,
+}
+
+
 # --- Object‑Mode Effect Operator ---
 class OBJECT_OT_curve_effects(bpy.types.Operator):
     """Apply various effects to all Bezier splines in Object Mode"""
@@ -348,6 +455,8 @@ class OBJECT_OT_curve_effects(bpy.types.Operator):
             return {'CANCELLED'}
 
         diff = self.max_scale - self.min_scale
+        # 半径系モードの計算関数をスプラインループの前に 1 回だけ解決
+        radius_fn = _RADIUS_MODES.get(self.mode)
 
         for spline in obj.data.splines:
             if spline.type != 'BEZIER':
@@ -359,50 +468,33 @@ class OBJECT_OT_curve_effects(bpy.types.Operator):
                 continue
 
             # オブジェクトモードでは常に全ポイントを対象
-            for i, p in enumerate(pts):
-                t = i/(n-1) if n>1 else 0.0
-
-                # 各モードの実装
-                if self.mode == 'CONST':
-                    p.radius = self.min_scale
-
-                elif self.mode == 'LINEAR':
-                    p.radius = self.min_scale + diff * t
-
-                elif self.mode == 'SINE':
-                    val = 0.5*(1 + math.sin(2*math.pi*self.cycles*t))
-                    p.radius = self.min_scale + diff * val
-
-                elif self.mode == 'QUAD':
-                    # t^2 による二次関数的増加
-                    p.radius = self.min_scale + diff * (t*t)
-
-                elif self.mode == 'TRI_LINEAR':
-                    if t <= 0.5:
-                        p.radius = self.min_scale + diff * (t/0.5)
-                    else:
-                        p.radius = self.max_scale - diff * ((t-0.5)/0.5)
+            # モード分岐はループの外で 1 回だけ評価し、配列演算で一括計算する
+            t = np.linspace(0.0, 1.0, n) if n > 1 else np.zeros(1)
 
-                elif self.mode == 'TRI_SMOOTH':
-                    u = (t*2.0) if t<=0.5 else (2.0*(1.0-t))
-                    s = u*u*(3.0 - 2.0*u)
-                    p.radius = self.min_scale + diff * s
+            with _SplineView(spline) as v:
+                if radius_fn is not None:
+                    v.radius[:] = radius_fn(t, self, diff)
+                    v.touch("radius")
 
                 elif self.mode == 'TWIST':
-                    p.tilt = self.twist_base + self.twist_step * t * (n-1)
+                    v.tilt[:] = self.twist_base + self.twist_step * t * (n - 1)
+                    v.touch("tilt")
 
                 elif self.mode == 'SPIRAL':
-                    ang = t * self.spiral_turns * 2 * math.pi
-                    r   = t * self.spiral_radius
-                    x = r*math.cos(ang)
-                    y = r*math.sin(ang)
-                    z = p.co.z
+                    ang = t * (self.spiral_turns * math.tau)
+                    r = t * self.spiral_radius
+                    x = r * np.cos(ang)
+                    y = r * np.sin(ang)
                     if self.spiral_axis == 'Z':
-                        p.co = Vector((x,y,z))
+                        v.co[:, 0] = x
+                        v.co[:, 1] = y
                     elif self.spiral_axis == 'Y':
-                        p.co = Vector((x,p.co.y,y))
+                        v.co[:, 0] = x
+                        v.co[:, 2] = y
                     else:
-                        p.co = Vector((p.co.x,x,y))
+                        v.co[:, 1] = x
+                        v.co[:, 2] = y
+                    v.touch("co")
 
         return {'FINISHED'}
 
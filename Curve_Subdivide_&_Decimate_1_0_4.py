@@ -11,31 +11,158 @@ bl_info = {
 }
 
 import bpy
+import heapq
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from mathutils import Vector
 
 # --- Ramer–Douglas–Peucker for index‐based decimation ---
+# numba があれば LLVM コンパイル版カーネルを使う（無くても動作する）
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _rdp_core(points, eps):
+        n = points.shape[0]
+        keep = np.zeros(n, dtype=np.bool_)
+        keep[0] = True
+        keep[n - 1] = True
+        stack = np.empty((2 * n, 2), dtype=np.int64)
+        stack[0, 0] = 0
+        stack[0, 1] = n - 1
+        top = 1
+        while top > 0:
+            top -= 1
+            i = stack[top, 0]
+            j = stack[top, 1]
+            if j <= i + 1:
+                continue
+            ax = points[i, 0]
+            ay = points[i, 1]
+            az = points[i, 2]
+            abx = points[j, 0] - ax
+            aby = points[j, 1] - ay
+            abz = points[j, 2] - az
+            ab2 = abx * abx + aby * aby + abz * abz
+            if ab2 == 0.0:
+                continue
+            max_d2 = 0.0
+            idx = -1
+            for k in range(i + 1, j):
+                px = points[k, 0] - ax
+                py = points[k, 1] - ay
+                pz = points[k, 2] - az
+                cx = py * abz - pz * aby
+                cy = pz * abx - px * abz
+                cz = px * aby - py * abx
+                d2 = cx * cx + cy * cy + cz * cz
+                if d2 > max_d2:
+                    max_d2 = d2
+                    idx = k
+            # 距離の 2 乗同士で比較して sqrt を排除
+            if idx >= 0 and max_d2 > eps * eps * ab2:
+                keep[idx] = True
+                stack[top, 0] = i
+                stack[top, 1] = idx
+                top += 1
+                stack[top, 0] = idx
+                stack[top, 1] = j
+                top += 1
+        return keep
+else:
+    def _rdp_core(points, eps):
+        n = points.shape[0]
+        keep = np.zeros(n, dtype=bool)
+        keep[0] = True
+        keep[n - 1] = True
+        stack = [(0, n - 1)]
+        while stack:
+            i, j = stack.pop()
+            if j <= i + 1:
+                continue
+            A = points[i]
+            AB = points[j] - A
+            ab2 = AB.dot(AB)
+            if ab2 == 0.0:
+                continue
+            # 全セグメント距離を一括計算（per-point ループ排除）
+            P = points[i + 1:j] - A
+            cross = np.cross(P, AB)
+            d2 = (cross * cross).sum(axis=1)
+            k = int(d2.argmax())
+            # 距離の 2 乗同士で比較して sqrt を排除
+            if d2[k] > eps * eps * ab2:
+                idx = i + 1 + k
+                keep[idx] = True
+                stack.append((i, idx))
+                stack.append((idx, j))
+        return keep
+
+
 def rdp_indices(points, eps):
+    points = np.asarray(points, dtype=np.float32)
     n = len(points)
     if n < 2:
         return list(range(n))
-    keep = {0, n - 1}
-    def recurse(i, j):
-        A, B = points[i], points[j]
-        AB = B - A
-        denom = AB.length
-        if denom == 0.0:
-            return
-        max_d, idx = 0.0, None
-        for k in range(i + 1, j):
-            d = (AB.cross(points[k] - A)).length / denom
-            if d > max_d:
-                max_d, idx = d, k
-        if max_d > eps and idx is not None:
-            keep.add(idx)
-            recurse(i, idx)
-            recurse(idx, j)
-    recurse(0, n - 1)
-    return sorted(keep)
+    return np.flatnonzero(_rdp_core(points, eps)).tolist()
+
+
+def _seg_candidate(points, i, j):
+    """セグメント (i, j) 内で最も逸脱の大きい点とその垂線距離²を返す"""
+    if j <= i + 1:
+        return None
+    A = points[i]
+    AB = points[j] - A
+    ab2 = AB.dot(AB)
+    P = points[i + 1:j] - A
+    if ab2 == 0.0:
+        # 始点と終点が一致：始点との距離で評価
+        d2 = (P * P).sum(axis=1)
+    else:
+        cross = np.cross(P, AB)
+        d2 = (cross * cross).sum(axis=1) / ab2
+    k = int(d2.argmax())
+    return float(d2[k]), i + 1 + k
+
+
+def rdp_topn_indices(points, target, eps=0.0):
+    """偏差の大きい点から順に採用し、target 点に達したら打ち切る top-N 版 RDP。
+
+    max-heap（heapq の負値キー）でセグメントを管理するので、出力
+    ポイント数が曲線のスケールに依らず予測可能になる。
+    """
+    points = np.asarray(points, dtype=np.float32)
+    n = len(points)
+    target = max(int(target), 2)
+    if n <= 2 or target >= n:
+        return list(range(n))
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = True
+    keep[n - 1] = True
+    heap = []
+    cand = _seg_candidate(points, 0, n - 1)
+    if cand is not None:
+        heapq.heappush(heap, (-cand[0], 0, n - 1, cand[1]))
+
+    kept = 2
+    eps2 = eps * eps
+    while heap and kept < target:
+        neg_d2, i, j, k = heapq.heappop(heap)
+        if -neg_d2 <= eps2:
+            break
+        keep[k] = True
+        kept += 1
+        for a, b in ((i, k), (k, j)):
+            cand = _seg_candidate(points, a, b)
+            if cand is not None:
+                heapq.heappush(heap, (-cand[0], a, b, cand[1]))
+
+    return np.flatnonzero(keep).tolist()
 
 
 # --- Subdivide Operator (Edit Mode) ---
@@ -53,24 +180,165 @@ class CURVE_OT_subdivide_curve(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.object and context.object.type == 'CURVE' and context.mode == 'EDIT_CURVE'
+        ob = context.object
+        return ob is not None and ob.type == 'CURVE' and context.mode == 'EDIT_CURVE'
 
     def execute(self, context):
         obj = context.object
         total_sel = 0
         for spline in obj.data.splines:
             if spline.type != 'BEZIER': continue
-            total_sel += sum(1 for p in spline.bezier_points if p.select_control_point)
+            pts = spline.bezier_points
+            sel = np.empty(len(pts), dtype=bool)
+            pts.foreach_get("select_control_point", sel)
+            total_sel += int(sel.sum())
 
         if total_sel >= 2:
             bpy.ops.curve.subdivide(number_cuts=self.cuts)
         else:
-            bpy.ops.curve.select_all(action='SELECT')
-            bpy.ops.curve.subdivide(number_cuts=self.cuts)
-            bpy.ops.curve.select_all(action='DESELECT')
+            # 全体細分化は bpy.ops を経由せずデータを直接編集する
+            # （select_all の往復と subdivide のオペレータオーバーヘッドを回避）
+            self._subdivide_all(obj.data, self.cuts)
 
         return {'FINISHED'}
 
+    @staticmethod
+    def _subdivide_spline_buffers(spline, cuts):
+        """1 本の BEZIER スプラインの細分化後バッファを de Casteljau 分割で計算"""
+        pts = spline.bezier_points
+        n = len(pts)
+        cyclic = spline.use_cyclic_u
+        nseg = n if cyclic else n - 1
+        if nseg < 1:
+            return None
+
+        co = np.empty(n * 3, dtype=np.float32)
+        hl = np.empty(n * 3, dtype=np.float32)
+        hr = np.empty(n * 3, dtype=np.float32)
+        radii = np.empty(n, dtype=np.float32)
+        tilts = np.empty(n, dtype=np.float32)
+        hlt = np.empty(n, dtype=np.int32)
+        hrt = np.empty(n, dtype=np.int32)
+        pts.foreach_get("co", co)
+        pts.foreach_get("handle_left", hl)
+        pts.foreach_get("handle_right", hr)
+        pts.foreach_get("radius", radii)
+        pts.foreach_get("tilt", tilts)
+        pts.foreach_get("handle_left_type", hlt)
+        pts.foreach_get("handle_right_type", hrt)
+        co = co.reshape(n, 3)
+        hl = hl.reshape(n, 3)
+        hr = hr.reshape(n, 3)
+
+        # 各セグメントの 3 次 Bezier 制御点 (nseg, 3)
+        i0 = np.arange(nseg)
+        i1 = (i0 + 1) % n
+        P0 = co[i0][:, None]
+        P1 = hr[i0][:, None]
+        P2 = hl[i1][:, None]
+        P3 = co[i1][:, None]
+
+        # 挿入パラメータとベジエ位置・接線を一括評価
+        tf = (np.arange(1, cuts + 1) / (cuts + 1)).astype(np.float32)
+        t = tf[None, :, None]
+        u = 1.0 - t
+        B = (u**3) * P0 + 3 * (u**2) * t * P1 + 3 * u * (t**2) * P2 + (t**3) * P3
+        dB = 3.0 * ((u**2) * (P1 - P0) + 2 * u * t * (P2 - P1) + (t**2) * (P3 - P2))
+
+        # 隣接分割点の間隔は一定なのでハンドル長も一定比率
+        dt3 = 1.0 / (3.0 * (cuts + 1))
+        stride = cuts + 1
+        out_n = n + cuts * nseg
+        idx_orig = np.arange(n) * stride
+        idx_new = (i0[:, None] * stride + np.arange(1, cuts + 1)[None, :]).ravel()
+
+        shrink = 1.0 / (cuts + 1)
+        co_out = np.empty((out_n, 3), dtype=np.float32)
+        hl_out = np.empty((out_n, 3), dtype=np.float32)
+        hr_out = np.empty((out_n, 3), dtype=np.float32)
+        co_out[idx_orig] = co
+        # 既存ポイントのハンドルは分割率に合わせて縮める
+        hl_out[idx_orig] = co + (hl - co) * shrink
+        hr_out[idx_orig] = co + (hr - co) * shrink
+        if not cyclic:
+            hl_out[0] = hl[0]
+            hr_out[idx_orig[-1]] = hr[-1]
+        co_out[idx_new] = B.reshape(-1, 3)
+        hl_out[idx_new] = (B - dt3 * dB).reshape(-1, 3)
+        hr_out[idx_new] = (B + dt3 * dB).reshape(-1, 3)
+
+        # radius / tilt は区間内で線形補間（Blender の subdivide と同様）
+        r_out = np.empty(out_n, dtype=np.float32)
+        t_out = np.empty(out_n, dtype=np.float32)
+        r_out[idx_orig] = radii
+        t_out[idx_orig] = tilts
+        w = tf[None, :]
+        r_out[idx_new] = (radii[i0][:, None] * (1 - w) + radii[i1][:, None] * w).ravel()
+        t_out[idx_new] = (tilts[i0][:, None] * (1 - w) + tilts[i1][:, None] * w).ravel()
+
+        # 挿入点は ALIGNED（接線上に両ハンドルが並ぶ）、既存点は型を維持
+        hlt_out = np.full(out_n, 3, dtype=np.int32)  # 3 = ALIGNED
+        hrt_out = np.full(out_n, 3, dtype=np.int32)
+        hlt_out[idx_orig] = hlt
+        hrt_out[idx_orig] = hrt
+
+        return (co_out, hl_out, hr_out, r_out, t_out, hlt_out, hrt_out, cyclic)
+
+    def _subdivide_all(self, data, cuts):
+        # 1) BEZIER スプラインの細分化後バッファを先に計算
+        spline_data = []
+        has_others = False
+        for spline in data.splines:
+            if spline.type != 'BEZIER':
+                has_others = True
+                continue
+            buffers = self._subdivide_spline_buffers(spline, cuts)
+            if buffers is not None:
+                # スプラインの設定は削除前に控えておく
+                spline_data.append((spline, spline.resolution_u,
+                                    spline.material_index, buffers))
+
+        # 2) 対象スプラインを削除して foreach_set で再構築
+        for spline, _, _, _ in spline_data:
+            data.splines.remove(spline)
+        for _, res, mat, (co, hl, hr, radii, tilts, hlt, hrt, cyclic) in spline_data:
+            sp = data.splines.new('BEZIER')
+            sp.bezier_points.add(len(co) - 1)
+            bp = sp.bezier_points
+            bp.foreach_set("co", co.ravel())
+            bp.foreach_set("handle_left", hl.ravel())
+            bp.foreach_set("handle_right", hr.ravel())
+            bp.foreach_set("radius", radii)
+            bp.foreach_set("tilt", tilts)
+            bp.foreach_set("handle_left_type", hlt)
+            bp.foreach_set("handle_right_type", hrt)
+            sp.use_cyclic_u = cyclic
+            sp.resolution_u = res
+            sp.material_index = mat
+
+        # 3) POLY / NURBS スプラインは従来どおりオペレーターで細分化する
+        #    （選択フラグを一括書き込みして対象を BEZIER 以外に絞る）
+        if has_others:
+            self._subdivide_non_bezier(data, cuts)
+
+    @staticmethod
+    def _subdivide_non_bezier(data, cuts):
+        for spline in data.splines:
+            if spline.type == 'BEZIER':
+                pts = spline.bezier_points
+                off = np.zeros(len(pts), dtype=bool)
+                pts.foreach_set("select_control_point", off)
+                pts.foreach_set("select_left_handle", off)
+                pts.foreach_set("select_right_handle", off)
+            else:
+                pts = spline.points
+                pts.foreach_set("select", np.ones(len(pts), dtype=bool))
+        bpy.ops.curve.subdivide(number_cuts=cuts)
+        for spline in data.splines:
+            if spline.type != 'BEZIER':
+                pts = spline.points
+                pts.foreach_set("select", np.zeros(len(pts), dtype=bool))
+
 
 # --- Decimate Operator (Edit Mode) ---
 class CURVE_OT_decimate_curve(bpy.types.Operator):
@@ -88,65 +356,134 @@ class CURVE_OT_decimate_curve(bpy.types.Operator):
         step=0.01,              # ← ここで矢印ボタン１回あたりの増減量を設定
         description="RDP の許容誤差 (大きいほどポイントが減少)"
     )
+    target: bpy.props.IntProperty(
+        name="Target Points",
+        default=0, min=0,
+        description="残すポイント数の上限 (0 で無効、誤差のみで間引く)"
+    )
+
+    # redo（パラメータ調整）中は gather 結果を使い回すキャッシュ。
+    # invoke で空にし、execute のたびに参照する。
+    _redo_cache = None
 
     @classmethod
     def poll(cls, context):
-        return context.object and context.object.type == 'CURVE' and context.mode == 'EDIT_CURVE'
+        ob = context.object
+        return ob is not None and ob.type == 'CURVE' and context.mode == 'EDIT_CURVE'
+
+    def invoke(self, context, event):
+        type(self)._redo_cache = {}
+        return self.execute(context)
 
     def execute(self, context):
         obj = context.object
         data = obj.data
+        cache = type(self)._redo_cache
 
         # 1) 各 BEZIER スプラインのデータと keep インデックスを先に収集
+        #    redo 中は error/target しか変わらないので、gather 結果は
+        #    （オブジェクト ID, スプライン番号, ポイント数）をキーに
+        #    キャッシュから再利用する。オブジェクト ID を含めるのは、
+        #    invoke を経ない実行（Repeat Last やスクリプト）で別カーブに
+        #    古いバッファを流用しないため
+        obj_ptr = obj.as_pointer()
+        if cache:
+            stale = [k for k in cache if k[0] != obj_ptr]
+            for k in stale:
+                del cache[k]
+
         spline_data = []
+        bez_index = 0
         for spline in data.splines:
             if spline.type != 'BEZIER':
                 continue
 
             pts = spline.bezier_points
-            coords = [p.co.copy() for p in pts]
-            radii = [p.radius for p in pts]
-            tilts = [p.tilt for p in pts]
-            hl_off = [(p.handle_left - p.co) for p in pts]
-            hr_off = [(p.handle_right - p.co) for p in pts]
+            n = len(pts)
+            key = (obj_ptr, bez_index, n)
+            bez_index += 1
+
+            if cache is not None and key in cache:
+                co, radii, tilts, hl_off, hr_off, rng = cache[key]
+                spline_data.append([spline, co, radii, tilts, hl_off, hr_off, rng])
+                continue
 
-            # 選択されたインデックスを取得
-            sel_idx = [i for i, p in enumerate(pts) if p.select_control_point]
-            contiguous = len(sel_idx) >= 2 and max(sel_idx) - min(sel_idx) == len(sel_idx) - 1
+            # 属性ごとに foreach_get で一括読み出し（RNA 往復は 1 回ずつ）
+            co = np.empty(n * 3, dtype=np.float32)
+            hl = np.empty(n * 3, dtype=np.float32)
+            hr = np.empty(n * 3, dtype=np.float32)
+            radii = np.empty(n, dtype=np.float32)
+            tilts = np.empty(n, dtype=np.float32)
+            pts.foreach_get("co", co)
+            pts.foreach_get("handle_left", hl)
+            pts.foreach_get("handle_right", hr)
+            pts.foreach_get("radius", radii)
+            pts.foreach_get("tilt", tilts)
+            co = co.reshape(n, 3)
+            hl_off = hl.reshape(n, 3) - co
+            hr_off = hr.reshape(n, 3) - co
 
+            # 選択フラグも foreach_get で一括取得
+            sel = np.empty(n, dtype=bool)
+            pts.foreach_get("select_control_point", sel)
+            sel_idx = np.flatnonzero(sel)
+            contiguous = sel_idx.size >= 2 and sel_idx[-1] - sel_idx[0] == sel_idx.size - 1
             if contiguous:
-                start, end = min(sel_idx), max(sel_idx)
-                sub_coords = coords[start:end+1]
-                keep_sub = rdp_indices(sub_coords, self.error)
-                # 全体インデックスにマッピング
-                keep = []
-                for i in range(len(coords)):
-                    if start <= i <= end:
-                        if (i - start) in keep_sub:
-                            keep.append(i)
-                    else:
-                        keep.append(i)
-                keep.sort()
+                start, end = int(sel_idx[0]), int(sel_idx[-1])
             else:
-                keep = rdp_indices(coords, self.error)
+                start, end = None, None
 
-            spline_data.append((coords, radii, tilts, hl_off, hr_off, keep))
+            if cache is not None:
+                cache[key] = (co, radii, tilts, hl_off, hr_off, (start, end))
+            spline_data.append([spline, co, radii, tilts, hl_off, hr_off, (start, end)])
 
-        # 2) 元の BEZIER スプラインをすべて削除
-        for spline in [s for s in data.splines if s.type == 'BEZIER']:
-            data.splines.remove(spline)
+        # 2) RDP は RNA に触れない純 NumPy/Numba 処理なのでスプライン単位で
+        #    並列実行できる（gather / rebuild はメインスレッドに限定）
+        # Target Points が設定されていれば top-N 版、なければ誤差のみの RDP
+        def run_rdp(points):
+            if self.target > 0:
+                return rdp_topn_indices(points, self.target, self.error)
+            return rdp_indices(points, self.error)
+
+        def compute_keep(entry):
+            _, co, _, _, _, _, (start, end) = entry
+            n = len(co)
+            if start is not None:
+                keep_sub = run_rdp(co[start:end+1])
+                # 全体インデックスへのマッピングは連結のみ
+                return np.concatenate((np.arange(0, start),
+                                       start + np.asarray(keep_sub, dtype=np.intp),
+                                       np.arange(end + 1, n)))
+            return run_rdp(co)
+
+        if len(spline_data) > 1:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                keeps = list(pool.map(compute_keep, spline_data))
+        else:
+            keeps = [compute_keep(entry) for entry in spline_data]
+
+        # 3) ポイントが減らなかったスプラインは remove+rebuild ごと省略
+        changed = [(entry, keep) for entry, keep in zip(spline_data, keeps)
+                   if len(keep) != len(entry[1])]
+        if not changed:
+            # 何も間引かれなければ undo ステップも積まない
+            return {'CANCELLED'}
+
+        for entry, _ in changed:
+            data.splines.remove(entry[0])
 
-        # 3) 収集したデータから再構築
-        for coords, radii, tilts, hl_off, hr_off, keep in spline_data:
+        # 4) 収集したデータから再構築（foreach_set で一括書き込み）
+        for (_, co, radii, tilts, hl_off, hr_off, _), keep in changed:
             sp = data.splines.new('BEZIER')
             sp.bezier_points.add(len(keep) - 1)
-            for idx_new, idx_old in enumerate(keep):
-                bp = sp.bezier_points[idx_new]
-                bp.co           = coords[idx_old].copy()
-                bp.radius       = radii[idx_old]
-                bp.tilt         = tilts[idx_old]
-                bp.handle_left  = coords[idx_old] + hl_off[idx_old]
-                bp.handle_right = coords[idx_old] + hr_off[idx_old]
+            keep = np.asarray(keep, dtype=np.intp)
+            new_co = co[keep]
+            bp = sp.bezier_points
+            bp.foreach_set("co", new_co.ravel())
+            bp.foreach_set("radius", radii[keep])
+            bp.foreach_set("tilt", tilts[keep])
+            bp.foreach_set("handle_left", (new_co + hl_off[keep]).ravel())
+            bp.foreach_set("handle_right", (new_co + hr_off[keep]).ravel())
 
         return {'FINISHED'}
 
@@ -178,6 +515,10 @@ classes = (
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    if njit is not None:
+        # JIT キャッシュのウォームアップ（初回 decimate のスパイク回避）
+        rdp_indices(np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0],
+                              [2.0, 1.0, 0.0], [3.0, 0.0, 0.0]]), 10.0)
 
 def unregister():
     for cls in reversed(classes):
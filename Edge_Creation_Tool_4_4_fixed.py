@@ -20,11 +20,24 @@ class OBJECT_OT_create_edge(bpy.types.Operator):
     bl_label = "Create Edge Tool"
     bl_options = {'REGISTER', 'UNDO'}
 
+    # Committing bm→mesh on every click is quadratic in stroke length;
+    # a ~30 Hz timer flushes only when something changed, and finish()
+    # always does the final commit
+    _timer = None
+
     @classmethod
     def poll(cls, context):
-        return context.area.type == 'VIEW_3D'
+        area = context.area
+        return area is not None and area.type == 'VIEW_3D'
 
     def modal(self, context, event):
+        if event.type == 'TIMER':
+            if self._dirty and self.bm and self.bm.is_valid and self.mesh:
+                self.bm.to_mesh(self.mesh)
+                self.mesh.update()
+                self._dirty = False
+            return {'RUNNING_MODAL'}
+
         if event.type == 'LEFTMOUSE' and event.value == 'PRESS':
             mouse_pos = (event.mouse_region_x, event.mouse_region_y)
             region = context.region
@@ -54,11 +67,11 @@ class OBJECT_OT_create_edge(bpy.types.Operator):
                     self.bm.edges.new((self.prev_vert, new_vert))
                 self.prev_vert = new_vert
 
-                self.bm.to_mesh(self.mesh)
-                self.mesh.update()
+                # Only mark the mesh dirty; the timer picks it up
+                self._dirty = True
 
         elif event.type in {'ESC', 'RIGHTMOUSE'}:
-            self.finish()
+            self.finish(context)
             return {'CANCELLED'}
 
         return {'RUNNING_MODAL'}
@@ -69,18 +82,33 @@ class OBJECT_OT_create_edge(bpy.types.Operator):
         self.bm = None
         self.prev_vert = None
         self.verts = []
+        self._dirty = False
 
         if context.area.type == 'VIEW_3D':
-            context.window_manager.modal_handler_add(self)
+            wm = context.window_manager
+            self._timer = wm.event_timer_add(1.0 / 30.0, window=context.window)
+            wm.modal_handler_add(self)
             return {'RUNNING_MODAL'}
         else:
             self.report({'WARNING'}, "View3D not found, cannot run operator")
             return {'CANCELLED'}
 
-    def finish(self):
+    def finish(self, context):
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+
         if self.bm:
             if self.mesh:
-                self.bm.to_mesh(self.mesh)
+                if len(self.verts) > 32:
+                    # For long polylines a single from_pydata build is
+                    # faster than committing the bmesh
+                    coords = [v.co[:] for v in self.verts]
+                    edges = [(i, i + 1) for i in range(len(coords) - 1)]
+                    self.mesh.clear_geometry()
+                    self.mesh.from_pydata(coords, edges, [])
+                else:
+                    self.bm.to_mesh(self.mesh)
                 self.mesh.update()
             self.bm.free()
             self.bm = None
@@ -92,7 +120,7 @@ class OBJECT_OT_create_edge(bpy.types.Operator):
             bpy.ops.mesh.select_all(action='SELECT')
 
     def cancel(self, context):
-        self.finish()
+        self.finish(context)
 
 class OBJECT_OT_fill_face(bpy.types.Operator):
     """Fill Face"""
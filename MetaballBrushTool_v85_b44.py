@@ -11,6 +11,7 @@ bl_info = {
 import bpy
 import time
 import math
+import numpy as np
 from mathutils import Vector
 from bpy.props import FloatProperty, PointerProperty, EnumProperty, BoolProperty
 from bpy.types import Operator, Panel, PropertyGroup
@@ -18,6 +19,14 @@ from bpy_extras import view3d_utils
 import gpu
 from gpu_extras.batch import batch_for_shader
 
+# プレビュー円の単位頂点（48 分割）はモジュール読み込み時に 1 回だけ計算
+_UNIT_CIRCLE = np.stack(
+    [np.cos(np.linspace(0.0, 2.0 * np.pi, 48, endpoint=False)),
+     np.sin(np.linspace(0.0, 2.0 * np.pi, 48, endpoint=False))],
+    axis=1).astype(np.float32)
+# ビルトインシェーダーも初回取得後に使い回す
+_preview_shader = None
+
 
 # -----------------------------
 # Properties
@@ -73,15 +82,26 @@ class MetaballBrushOperator(Operator):
     _last_mouse = (0, 0)
     _last_pressure = 0.0
     _draw_handle = None
+    # ストローク中の配置 (x, y, z, radius) を溜めるバッファと反映済み件数
+    _pending = None
+    _committed = 0
+    # ストローク開始時に確定するミラー符号の組み合わせ
+    _signs = ((1.0, 1.0, 1.0),)
+    # SNAP モード用：ストローク中に使い回す評価済み depsgraph
+    _snap_dg = None
+    # invoke 時に束縛しておく参照（tick ごとの属性ルックアップ削減）
+    _props = None
+    _time = time.time
 
     # ---------- modal loop ----------
     def modal(self, context, event):
-        props = context.scene.metaball_brush_props
+        props = self._props
 
         if event.type == 'TIMER':
-            if self._mouse_down and (time.time() - self._last_time) >= props.interval:
+            now = self._time()
+            if self._mouse_down and (now - self._last_time) >= props.interval:
                 self.add_metaball(context, *self._last_mouse, self._last_pressure)
-                self._last_time = time.time()
+                self._last_time = now
             return {'RUNNING_MODAL'}
 
         elif event.type == 'MOUSEMOVE':
@@ -103,18 +123,33 @@ class MetaballBrushOperator(Operator):
                 context.view_layer.objects.active = obj
                 obj.select_set(True)
                 self._obj = obj
+                self._pending = []
+                self._committed = 0
+                # 符号の組み合わせはストロークごとに 1 回だけ生成
+                self._signs = self._mirror_signs(props)
+
+                if props.draw_mode == 'SNAP':
+                    # depsgraph はストローク開始時に 1 回だけ取得して使い回す
+                    self._snap_dg = context.evaluated_depsgraph_get()
 
             elif event.value == 'RELEASE':
                 self._mouse_down = False
+                # 溜めた要素をまとめて生成し、メタボール再計算は
+                # ストロークにつき 1 回で済ませる
+                self._flush_pending(props)
                 if props.undo_mode == 'STROKE':
                     try:
                         bpy.ops.ed.undo_push(message="Metaball Stroke")
                     except Exception:
                         pass
                 self._obj = None
+                self._pending = None
+                self._snap_dg = None
             return {'RUNNING_MODAL'}
 
         elif event.type in {'RIGHTMOUSE', 'ESC'}:
+            # ストローク途中で抜けた場合も未反映分を書き込んでおく
+            self._flush_pending(props)
             self.finish(context)
             return {'CANCELLED'}
 
@@ -122,7 +157,7 @@ class MetaballBrushOperator(Operator):
 
     # ---------- add one metaball element (with mirror & pressure curve) ----------
     def add_metaball(self, context, x, y, pressure):
-        props = context.scene.metaball_brush_props
+        props = self._props
         region = context.region
         rv3d = context.region_data
 
@@ -142,26 +177,26 @@ class MetaballBrushOperator(Operator):
             cursor = context.scene.cursor.location
             location_world = view3d_utils.region_2d_to_location_3d(region, rv3d, (x, y), cursor)
         elif props.draw_mode == 'SNAP':
-            depsgraph = context.evaluated_depsgraph_get()
-            nearest_hit_dist = None
+            # オブジェクトごとの ray_cast ループをやめ、シーン BVH に対する
+            # 1 本のレイで最近接ヒットを取る。自分のストロークに当たった
+            # 場合はヒット位置の少し先から再キャストして読み飛ばす
+            dg = self._snap_dg or context.evaluated_depsgraph_get()
+            scene = context.scene
+            ray_origin = origin
             nearest_hit_loc = None
-            for obj in context.visible_objects:
-                if obj == self._obj:
-                    continue
+            for _ in range(4):
                 try:
-                    eval_obj = obj.evaluated_get(depsgraph)
-                    mat_inv = eval_obj.matrix_world.inverted()
-                    ro = mat_inv @ origin
-                    rd = (mat_inv.to_3x3() @ direction).normalized()
-                    hit, loc, normal, face_index = eval_obj.ray_cast(ro, rd)
-                    if hit:
-                        world_loc = eval_obj.matrix_world @ loc
-                        dist = (world_loc - origin).length
-                        if nearest_hit_dist is None or dist < nearest_hit_dist:
-                            nearest_hit_dist = dist
-                            nearest_hit_loc = world_loc
+                    result, loc, normal, index, hit_obj, matrix = scene.ray_cast(
+                        dg, ray_origin, direction)
                 except Exception:
+                    break
+                if not result:
+                    break
+                if hit_obj == self._obj:
+                    ray_origin = loc + direction * 1e-4
                     continue
+                nearest_hit_loc = loc
+                break
             location_world = nearest_hit_loc if nearest_hit_loc else (origin + direction * props.view_depth)
         else:
             location_world = origin + direction * props.view_depth
@@ -177,36 +212,57 @@ class MetaballBrushOperator(Operator):
         mw_inv = self._obj.matrix_world.inverted()
         base_local = mw_inv @ location_world  # Vector
 
-        # ミラーの符号セット（選択された軸の全組み合わせを生成）
-        signs = [(1.0, 1.0, 1.0)]
-        if props.mirror_x:
-            signs = signs + [(-sx, sy, sz) for (sx, sy, sz) in signs]
-        if props.mirror_y:
-            signs = signs + [(sx, -sy, sz) for (sx, sy, sz) in signs]
-        if props.mirror_z:
-            signs = signs + [(sx, sy, -sz) for (sx, sy, sz) in signs]
-
-        # 重複回避のため位置キー（丸め）で集合管理
-        placed_keys = set()
-        for sx, sy, sz in signs:
-            local = Vector((base_local.x * sx, base_local.y * sy, base_local.z * sz))
-            key = (round(local.x, 7), round(local.y, 7), round(local.z, 7))
-            if key in placed_keys:
+        # 符号の組み合わせは構築時点で重複しないので集合は不要。
+        # 座標がほぼ 0 の軸だけ、反転しても同一点になるためスキップする
+        fx = abs(base_local.x) > 1e-7
+        fy = abs(base_local.y) > 1e-7
+        fz = abs(base_local.z) > 1e-7
+        for sx, sy, sz in self._signs:
+            if (sx < 0 and not fx) or (sy < 0 and not fy) or (sz < 0 and not fz):
                 continue
-            placed_keys.add(key)
+            self._pending.append((base_local.x * sx,
+                                  base_local.y * sy,
+                                  base_local.z * sz, radius))
 
+        if props.undo_mode == 'ELEMENT':
+            # 要素単位 undo のときだけ即時反映する
+            self._flush_pending(props)
             try:
-                elem = self._obj.data.elements.new(type='BALL')
-                elem.co = local             # ★ローカル座標で配置
-                elem.radius = radius
+                bpy.ops.ed.undo_push(message="Add Metaball Element(s)")
             except Exception:
                 pass
 
+    @staticmethod
+    def _mirror_signs(props):
+        """有効なミラー軸から符号の組み合わせを生成（重複なし・最大 8 通り）"""
+        signs = [(1.0, 1.0, 1.0)]
+        if props.mirror_x:
+            signs += [(-sx, sy, sz) for (sx, sy, sz) in signs]
+        if props.mirror_y:
+            signs += [(sx, -sy, sz) for (sx, sy, sz) in signs]
+        if props.mirror_z:
+            signs += [(sx, sy, -sz) for (sx, sy, sz) in signs]
+        return tuple(signs)
+
+    # ---------- flush pending placements in one batch ----------
+    def _flush_pending(self, props):
+        """バッファの未反映分を一括生成し、foreach_set で座標・半径を書き込む"""
+        if self._obj is None or self._obj.type != 'META' or not self._pending:
+            return
+        data = self._obj.data
+        n_new = len(self._pending) - self._committed
+        if n_new <= 0:
+            return
         try:
-            self._obj.data.resolution = props.resolution
-            self._obj.data.update()
-            if props.undo_mode == 'ELEMENT':
-                bpy.ops.ed.undo_push(message="Add Metaball Element(s)")
+            for _ in range(n_new):
+                data.elements.new(type='BALL')
+            # このオブジェクトはストローク専用なので全要素 = バッファ内容
+            buf = np.asarray(self._pending, dtype=np.float32)
+            data.elements.foreach_set("co", np.ascontiguousarray(buf[:, :3]).ravel())
+            data.elements.foreach_set("radius", np.ascontiguousarray(buf[:, 3]))
+            self._committed = len(self._pending)
+            data.resolution = props.resolution
+            data.update()
         except Exception:
             pass
 
@@ -215,7 +271,7 @@ class MetaballBrushOperator(Operator):
         if not context.region:
             return
         x, y = self._last_mouse
-        props = context.scene.metaball_brush_props
+        props = self._props
 
         if self._last_pressure and self._last_pressure > 0.0:
             adj = self._last_pressure ** props.pressure_curve
@@ -226,10 +282,13 @@ class MetaballBrushOperator(Operator):
         r_px = int(20 + 15 * radius)
         r_px = max(12, min(120, r_px))
 
-        verts = [(x + r_px * math.cos(2*math.pi*i/48),
-                  y + r_px * math.sin(2*math.pi*i/48)) for i in range(48)]
+        # 単位円をスケール＋平行移動するだけ（cos/sin の再計算なし）
+        verts = _UNIT_CIRCLE * r_px + np.array((x, y), dtype=np.float32)
 
-        shader = gpu.shader.from_builtin('2D_UNIFORM_COLOR')
+        global _preview_shader
+        if _preview_shader is None:
+            _preview_shader = gpu.shader.from_builtin('2D_UNIFORM_COLOR')
+        shader = _preview_shader
         batch = batch_for_shader(shader, 'LINE_LOOP', {"pos": verts})
 
         gpu.state.blend_set('ALPHA')
@@ -240,12 +299,14 @@ class MetaballBrushOperator(Operator):
 
     # ---------- invoke / finish ----------
     def invoke(self, context, event):
-        props = context.scene.metaball_brush_props
+        # モーダル中に毎イベント参照するものはここで一度だけ束縛する
+        self._props = props = context.scene.metaball_brush_props
+        self._time = time.time
         self._obj = None
         self._last_mouse = (event.mouse_region_x, event.mouse_region_y)
         self._mouse_down = False
         self._last_pressure = getattr(event, "pressure", 0.0)
-        self._last_time = time.time()
+        self._last_time = self._time()
 
         wm = context.window_manager
         self._timer = wm.event_timer_add(props.interval, window=context.window)
@@ -285,6 +346,7 @@ class VIEW3D_PT_metaball_brush_panel(Panel):
 
     def draw(self, context):
         props = context.scene.metaball_brush_props
+        draw_mode = props.draw_mode
         layout = self.layout
 
         layout.operator("object.metaball_brush_v85", text="Start Brush (v8.5)", icon='BRUSH_DATA')
@@ -301,7 +363,8 @@ class VIEW3D_PT_metaball_brush_panel(Panel):
         box.label(text="Placement")
         box.prop(props, "interval")
         box.prop(props, "resolution")
-        if props.draw_mode == 'VIEW':
+        # enum は一度だけ読む（draw は再描画ごとに呼ばれる）
+        if draw_mode == 'VIEW':
             box.prop(props, "view_depth")
 
         box.separator()
@@ -12,8 +12,11 @@ bl_info = {
 
 import bpy
 
-# プロパティグループの定義（トグルオプション用）
-class LanguageSwitcherProperties(bpy.types.PropertyGroup):
+# トグルオプションはシーンごとの PropertyGroup ではなくアドオン設定に
+# 1 インスタンスだけ持つ（シーン複製やファイル保存で増えない）
+class LanguageSwitcherPrefs(bpy.types.AddonPreferences):
+    bl_idname = __name__
+
     toggle_interface: bpy.props.BoolProperty(
         name="Interface",
         description="Enable/Disable interface translation",
@@ -35,12 +38,20 @@ class LanguageSwitcherProperties(bpy.types.PropertyGroup):
         default=False,
     )
 
+    def draw(self, context):
+        row = self.layout.row(align=True)
+        row.prop(self, "toggle_interface")
+        row.prop(self, "toggle_tooltips")
+        row.prop(self, "toggle_reports")
+        row.prop(self, "toggle_new_data")
+
 # オペレーター: 言語切り替え
 class SwitchLanguageOperator(bpy.types.Operator):
     """Switch Blender language between Japanese and English with toggles"""
     bl_idname = "wm.switch_language"
     bl_label = "Switch Language"
-    bl_options = {'REGISTER', 'UNDO'}
+    # 設定変更は undo スタックに乗らないため UNDO は付けない
+    bl_options = {'REGISTER'}
 
     language: bpy.props.StringProperty(default="")
 
@@ -49,19 +60,17 @@ class SwitchLanguageOperator(bpy.types.Operator):
             self.report({'ERROR'}, "Unsupported language")
             return {'CANCELLED'}
 
-        # 言語設定を切り替え
-        bpy.context.preferences.view.language = self.language
-        props = context.scene.language_switcher_props
-
-        bpy.context.preferences.view.use_translate_interface = props.toggle_interface
-        bpy.context.preferences.view.use_translate_tooltips = props.toggle_tooltips
-        bpy.context.preferences.view.use_translate_new_dataname = props.toggle_new_data
+        # 言語設定を切り替え（preferences.view は 1 回だけ解決し、
+        # 各プロパティへの書き込みも 1 回ずつにする。
+        # use_translate_tooltips / use_translate_new_dataname は 2.80 以降
+        # 常に存在するので hasattr ガードは不要）
+        view = context.preferences.view
+        props = context.preferences.addons[__name__].preferences
 
-        # ツールチップやレポート翻訳の有効化（レポート翻訳はシステムに依存）
-        if hasattr(bpy.context.preferences.view, "use_translate_tooltips"):
-            bpy.context.preferences.view.use_translate_tooltips = props.toggle_tooltips
-        if hasattr(bpy.context.preferences.view, "use_translate_new_dataname"):
-            bpy.context.preferences.view.use_translate_new_dataname = props.toggle_new_data
+        view.language = self.language
+        view.use_translate_interface = props.toggle_interface
+        view.use_translate_tooltips = props.toggle_tooltips
+        view.use_translate_new_dataname = props.toggle_new_data
 
         self.report(
             {'INFO'},
@@ -78,44 +87,70 @@ class LanguageSwitcherPanel(bpy.types.Panel):
     bl_region_type = 'UI'
     bl_category = "Sculpt Tools"
 
+    # draw は再描画のたびに呼ばれるため、オペレーター ID はクラス定数に持つ
+    _SWITCH_OP = SwitchLanguageOperator.bl_idname
+
+    @classmethod
+    def poll(cls, context):
+        # アドオン設定が引けない状態では draw を呼ばせない
+        return __name__ in context.preferences.addons
+
     def draw(self, context):
         layout = self.layout
-        props = context.scene.language_switcher_props
-
-        layout.label(text="Language Settings:")
-        layout.prop(props, "toggle_interface", text="Interface Translation")
-        layout.prop(props, "toggle_tooltips", text="Tooltips Translation")
-        layout.prop(props, "toggle_reports", text="Report Translation")
-        layout.prop(props, "toggle_new_data", text="New Data Translation")
-
-        # 日本語切り替えボタン
-        layout.operator(
-            SwitchLanguageOperator.bl_idname,
-            text="Switch to Japanese"
-        ).language = "ja_JP"
-
-        # 英語切り替えボタン
-        layout.operator(
-            SwitchLanguageOperator.bl_idname,
-            text="Switch to English"
-        ).language = "en_US"
+        props = context.preferences.addons[__name__].preferences
+
+        # トグルは 1 つの column にまとめてレイアウト計算を減らす
+        # （装飾だけのラベルは置かない）
+        col = layout.column(align=True)
+        col.prop(props, "toggle_interface", text="Interface Translation")
+        col.prop(props, "toggle_tooltips", text="Tooltips Translation")
+        col.prop(props, "toggle_reports", text="Report Translation")
+        col.prop(props, "toggle_new_data", text="New Data Translation")
+
+        # 切り替えボタンは 1 行にまとめてウィジェット数を減らす
+        row = layout.row(align=True)
+        row.operator(self._SWITCH_OP, text="Switch to Japanese").language = "ja_JP"
+        row.operator(self._SWITCH_OP, text="Switch to English").language = "en_US"
 
 # 登録と解除
-classes = [
-    LanguageSwitcherProperties,
+# アドオン設定だけ即時登録し、オペレーターとパネルはタイマーで遅延登録する。
+# パネルはボタンが参照するオペレーターと同じタイミング（後）で登録し、
+# 未登録 ID を描画して例外になる窓を作らない
+_ESSENTIAL_CLASSES = (
+    LanguageSwitcherPrefs,
+)
+_LAZY_CLASSES = (
     SwitchLanguageOperator,
     LanguageSwitcherPanel,
-]
+)
+_lazy_registered = False
+
+# Python ループの代わりに factory のクロージャで登録・解除する
+_register_essential, _unregister_essential = bpy.utils.register_classes_factory(_ESSENTIAL_CLASSES)
+_register_lazy, _unregister_lazy = bpy.utils.register_classes_factory(_LAZY_CLASSES)
+
+
+def _register_lazy_classes():
+    global _lazy_registered
+    if not _lazy_registered:
+        _register_lazy()
+        _lazy_registered = True
+    return None  # タイマーを解除
+
 
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-    bpy.types.Scene.language_switcher_props = bpy.props.PointerProperty(type=LanguageSwitcherProperties)
+    _register_essential()
+    bpy.app.timers.register(_register_lazy_classes, first_interval=0.1)
+
 
 def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
-    del bpy.types.Scene.language_switcher_props
+    global _lazy_registered
+    if bpy.app.timers.is_registered(_register_lazy_classes):
+        bpy.app.timers.unregister(_register_lazy_classes)
+    if _lazy_registered:
+        _unregister_lazy()
+        _lazy_registered = False
+    _unregister_essential()
 
 if __name__ == "__main__":
     register()
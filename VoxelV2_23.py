@@ -10,6 +10,8 @@ bl_info = {
 
 import bpy
 import bmesh
+import numpy as np
+from bpy_extras import view3d_utils
 from bpy.types import Operator, Panel
 from bpy.props import BoolProperty, FloatProperty, EnumProperty
 
@@ -19,15 +21,33 @@ from bpy.props import BoolProperty, FloatProperty, EnumProperty
 def apply_all_modifiers(obj):
     """
     指定されたオブジェクトのすべてのモディファイアを適用する。
+
+    modifier_apply をモディファイアごとに呼ぶと depsgraph 更新と
+    undo push が N 回走るため、評価済みメッシュを 1 回だけ取り出して
+    データを差し替える。
+
+    選択状態には一切触れない（呼び出し側で一括管理する前提）。
     """
-    if obj.modifiers:
-        bpy.ops.object.select_all(action='DESELECT')  # 他のオブジェクトの選択解除
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode='OBJECT')  # 確実にオブジェクトモードへ変更
-        
-        for mod in obj.modifiers[:]:
-            bpy.ops.object.modifier_apply(modifier=mod.name)
+    if not obj.modifiers:
+        return
+    if obj.type != 'MESH':
+        # 非メッシュ型は convert_to_mesh 側の convert がモディファイアごと
+        # 一括でメッシュ化するので、ここでは何もしない
+        return
+
+    # モード切り替えは呼び出し側が最初に 1 回だけ行う前提
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    # リメッシュ前提なのでシェイプキーや追加データレイヤーは意図的に
+    # 持ち越さない（preserve_all_data_layers=False）。join までのメモリ
+    # コピー量が減る
+    new_mesh = bpy.data.meshes.new_from_object(
+        eval_obj, preserve_all_data_layers=False, depsgraph=depsgraph)
+    old_mesh = obj.data
+    obj.data = new_mesh
+    obj.modifiers.clear()
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
 
 # -----------------------------------------------------
 # ✅ Voxel Remesh を適用するオペレーター
@@ -93,39 +113,66 @@ class OBJECT_OT_voxel_remesh_sculpt_v2(Operator):
         merged_objects = []  # 統合するオブジェクトのリスト
         skipped_objects = []  # メッシュ化できなかったオブジェクト
 
-        for obj in selected_objects:
-            context.view_layer.objects.active = obj
-            
-            if self.apply_modifiers:
-                apply_all_modifiers(obj)  # ✅ すべてのモデファイヤを適用
+        # ループ内で毎回 RNA を辿らないよう、よく使う参照はローカルに束縛
+        view_objects = context.view_layer.objects
 
-            # `convert_to_mesh(obj)` を使ってメッシュ化を統一処理
-            converted_obj = convert_to_mesh(obj)
+        # 選択解除はループ前に 1 回だけ行い、以降は個別の select_set で管理
+        bpy.ops.object.select_all(action='DESELECT')
 
-            if converted_obj:
-                merged_objects.append(converted_obj)
+        # メッシュとメッシュ化可能オブジェクトに振り分ける
+        mesh_objs = []
+        convertible_objs = []
+        for obj in selected_objects:
+            if obj.type == 'MESH':
+                mesh_objs.append(obj)
+            elif obj.type in {'CURVE', 'META', 'SURFACE', 'FONT'}:
+                convertible_objs.append(obj)
             else:
                 skipped_objects.append(obj.name)
 
+        if self.apply_modifiers:
+            for obj in mesh_objs:
+                # モディファイアなしの素のメッシュはアクティブ切り替えごと
+                # スキップする
+                if not obj.modifiers:
+                    continue
+                view_objects.active = obj
+                apply_all_modifiers(obj)  # ✅ すべてのモデファイヤを適用
+
+        # convert は複数選択をまとめて処理できるので、メッシュ化可能
+        # オブジェクトを全選択して 1 回だけ呼ぶ（モディファイアも適用される）
+        if convertible_objs:
+            for obj in convertible_objs:
+                obj.select_set(True)
+            view_objects.active = convertible_objs[0]
+            bpy.ops.object.convert(target='MESH')
+            for obj in convertible_objs:
+                obj.select_set(False)
+
+        merged_objects.extend(mesh_objs)
+        merged_objects.extend(convertible_objs)
+
         # メッシュ化できなかったオブジェクトの警告
         if skipped_objects:
             self.report({'WARNING'}, f"Some objects could not be converted to mesh: {', '.join(skipped_objects)}")
 
-        # 複数のオブジェクトを統合
+        # 複数のオブジェクトを統合（全体はすでに選択解除済み）。
+        # 1 個だけでもモディファイア追加とモード変更の対象になるよう、
+        # 必ず先頭をアクティブにする
         if len(merged_objects) > 1:
-            bpy.ops.object.select_all(action='DESELECT')
             for obj in merged_objects:
                 obj.select_set(True)
-            context.view_layer.objects.active = merged_objects[0]
+            view_objects.active = merged_objects[0]
             bpy.ops.object.join()
+        elif merged_objects:
+            merged_objects[0].select_set(True)
+            view_objects.active = merged_objects[0]
 
         # 統合後のアクティブオブジェクトを取得
-        active_obj = context.view_layer.objects.active
+        active_obj = view_objects.active
 
-        # Voxel Remesh モディファイアを追加
-        bpy.ops.object.modifier_add(type='REMESH')
-        remesh_modifier = active_obj.modifiers[-1]
-        remesh_modifier.name = "Voxel Remesh"
+        # Voxel Remesh モディファイアを追加（ops を介さず直接生成）
+        remesh_modifier = active_obj.modifiers.new(name="Voxel Remesh", type='REMESH')
         remesh_modifier.mode = 'VOXEL'
         remesh_modifier.voxel_size = self.voxel_size
         remesh_modifier.use_smooth_shade = True
@@ -153,21 +200,16 @@ class OBJECT_OT_apply_voxel_remesh_face_sets(Operator):
             self.report({'WARNING'}, "No active object.")
             return {'CANCELLED'}
 
-        # リメッシュモディファイアを探す
-        remesh_mod = None
-        for mod in active_obj.modifiers:
-            if mod.name == "Voxel Remesh":
-                remesh_mod = mod
-                break
-
-        if not remesh_mod:
+        # リメッシュモディファイアは名前で直接引く（線形走査しない）
+        remesh_mod = active_obj.modifiers.get("Voxel Remesh")
+        if remesh_mod is None:
             self.report({'WARNING'}, "Voxel Remesh modifier not found.")
             return {'CANCELLED'}
 
         # リメッシュパラメータを記録
         rec_voxel_size = remesh_mod.voxel_size
         rec_adaptivity = remesh_mod.adaptivity
-        bpy.ops.object.modifier_remove(modifier="Voxel Remesh")  # モディファイアを削除
+        active_obj.modifiers.remove(remesh_mod)  # ops を介さず直接削除
 
         # スカルプトモードへ変更
         bpy.ops.object.mode_set(mode='SCULPT')
@@ -196,25 +238,24 @@ def convert_to_mesh(obj):
     :param obj: 処理対象のオブジェクト
     :return: メッシュ化されたオブジェクト or None（変換不可）
     """
-    # 既にメッシュならそのまま返す
+    # 既にメッシュならそのまま返す（モディファイアには触れない。
+    # 適用するかどうかは呼び出し側が apply_all_modifiers で明示的に決める）
     if obj.type == 'MESH':
         return obj
 
-    # モディファイヤが付いている場合、すべて適用
-    if obj.modifiers:
-        bpy.ops.object.select_all(action='DESELECT')  # 他のオブジェクトを選択解除
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-        for mod in obj.modifiers[:]:
-            bpy.ops.object.modifier_apply(modifier=mod.name)
+    # 非メッシュの convert はモディファイアも一括で適用するため、
+    # 事前の modifier_apply ループは不要
 
     # メッシュに変換可能なオブジェクトの場合
+    # （呼び出し側で全選択解除済みの前提なので、対象だけを選択し
+    # 変換後に戻す）
     if obj.type in {'CURVE', 'META', 'SURFACE', 'FONT'}:
-        bpy.ops.object.select_all(action='DESELECT')  # 他のオブジェクトを選択解除
         obj.select_set(True)
         bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode='OBJECT')  # 念のためオブジェクトモードへ
+        if bpy.context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')  # 念のためオブジェクトモードへ
         bpy.ops.object.convert(target='MESH')  # メッシュに変換
+        obj.select_set(False)
         return obj  # メッシュ化したオブジェクトを返す
 
     # メッシュ化できないオブジェクトの場合、None を返す
@@ -224,6 +265,11 @@ def convert_to_mesh(obj):
 # ✅ 面セットを作成するオペレーター
 # -----------------------------------------------------
 
+# 面数ごとの書き込みバッファ。同じサイズのオブジェクトが並ぶ場合の
+# 再確保を避ける
+_FACE_SET_BUF = {}
+
+
 class OBJECT_OT_create_face_sets(Operator):
     """Face Set を作成（カーブ・メタボール・モディファイヤ適用対応）"""
     bl_idname = "object.create_face_sets"
@@ -240,9 +286,15 @@ class OBJECT_OT_create_face_sets(Operator):
         processed_objects = []  # メッシュ化されたオブジェクトを保持するリスト
         skipped_objects = []  # メッシュ化できないオブジェクトを記録するリスト
 
+        # ループ内で毎回 RNA を辿らないよう、よく使う参照はローカルに束縛
+        view_objects = context.view_layer.objects
+
+        # 選択解除はループ前に 1 回だけ
+        bpy.ops.object.select_all(action='DESELECT')
+
         for obj in selected_objects:
-            context.view_layer.objects.active = obj
-            
+            view_objects.active = obj
+
             converted_obj = convert_to_mesh(obj)  # メッシュ化ルーチンを呼び出す
 
             if converted_obj:
@@ -250,26 +302,29 @@ class OBJECT_OT_create_face_sets(Operator):
             else:
                 skipped_objects.append(obj.name)
 
+        # スカルプトモードでのマスク 3 連オペレーター（全マスク→Face Set
+        # 作成→マスク解除）はそれぞれ全メッシュを走査する。目的は
+        # 「オブジェクト全面を 1 つの Face Set にする」ことなので、
+        # .sculpt_face_set 属性へ foreach_set で直接書き込む
         for obj in processed_objects:
-            context.view_layer.objects.active = obj
-            bpy.ops.object.mode_set(mode='SCULPT')  # スカルプトモードに変更
-
-            # オブジェクト全体をマスク
-            bpy.ops.paint.mask_flood_fill(mode='VALUE', value=1)
-
-            # マスクから Face Set を作成
-            bpy.ops.sculpt.face_sets_create(mode='MASKED')
-
-            # マスクを解除
-            bpy.ops.paint.mask_flood_fill(mode='VALUE', value=0)
-
-            bpy.ops.object.mode_set(mode='OBJECT')  # オブジェクトモードに戻る
-
-        # 【追加】メッシュ化できなかったオブジェクトの警告表示
+            mesh = obj.data
+            attr = mesh.attributes.get(".sculpt_face_set")
+            if attr is None:
+                attr = mesh.attributes.new(".sculpt_face_set", 'INT', 'FACE')
+            n_polys = len(mesh.polygons)
+            arr = _FACE_SET_BUF.get(n_polys)
+            if arr is None:
+                arr = _FACE_SET_BUF[n_polys] = np.ones(n_polys, dtype=np.int32)
+            attr.data.foreach_set("value", arr)
+            mesh.update()
+        # 属性書き込みだけで完結するのでモード切り替えは一切不要。
+        # ユーザーのモードはそのまま維持される
+
+        # レポートは 1 回にまとめる（report ごとにステータスバーが再描画される）
+        msg_parts = [f"Face sets created for {len(processed_objects)} object(s)"]
         if skipped_objects:
-            self.report({'WARNING'}, f"Some objects could not be converted to mesh: {', '.join(skipped_objects)}")
-
-        self.report({'INFO'}, "Face sets created for selected objects.")
+            msg_parts.append(f"Skipped: {', '.join(skipped_objects)}")
+        self.report({'WARNING'} if skipped_objects else {'INFO'}, "; ".join(msg_parts))
         return {'FINISHED'}
         
 # -----------------------------------------------------
@@ -291,8 +346,11 @@ class OBJECT_OT_convert_to_mesh(Operator):
         skipped_objects = []  # メッシュ化できなかったオブジェクト
         converted_objects = []  # メッシュ化成功したオブジェクト
 
+        # 選択解除はループ前に 1 回だけ
+        bpy.ops.object.select_all(action='DESELECT')
+
         for obj in selected_objects:
-        
+
             converted_obj = convert_to_mesh(obj)
             
             if converted_obj:
@@ -300,10 +358,14 @@ class OBJECT_OT_convert_to_mesh(Operator):
             else:
                 skipped_objects.append(obj.name)
 
+        # レポートは 1 回にまとめる
+        msg_parts = []
         if converted_objects:
-            self.report({'INFO'}, f"Converted {len(converted_objects)} object(s) to mesh.")
+            msg_parts.append(f"Converted {len(converted_objects)} object(s) to mesh")
         if skipped_objects:
-            self.report({'WARNING'}, f"Some objects could not be converted: {', '.join(skipped_objects)}")
+            msg_parts.append(f"Skipped: {', '.join(skipped_objects)}")
+        if msg_parts:
+            self.report({'WARNING'} if skipped_objects else {'INFO'}, "; ".join(msg_parts))
 
         return {'FINISHED'}
 
@@ -320,7 +382,7 @@ class SCULPT_OT_face_set_to_mask(bpy.types.Operator):
     def modal(self, context, event):
         if event.type == 'LEFTMOUSE' and event.value == 'PRESS':
             # マウスクリックされたら処理を実行
-            self.execute_mask_process(context)
+            self.execute_mask_process(context, event)
             return {'FINISHED'}
 
         elif event.type in {'RIGHTMOUSE', 'ESC'}:
@@ -335,17 +397,56 @@ class SCULPT_OT_face_set_to_mask(bpy.types.Operator):
         self.report({'INFO'}, "Click on a Face Set to apply the mask")
         return {'RUNNING_MODAL'}
 
-    def execute_mask_process(self, context):
-        """マウス位置のFace Setに対してマスクを適用"""
+    def execute_mask_process(self, context, event):
+        """マウス位置のFace Setに対してマスクを適用
+
+        可視切り替え＋マスク塗りつぶし 4 連オペレーター（いずれも全メッシュ
+        走査）の代わりに、クリック位置をレイキャストして Face Set ID を読み、
+        .sculpt_mask 属性へ直接書き込む（メッシュ走査は 1 回だけ）。
+        """
         obj = context.active_object
-        if obj and obj.mode == 'SCULPT':
-            bpy.ops.sculpt.face_set_change_visibility(mode='HIDE_ACTIVE')  # Face Set を隠す
-            bpy.ops.paint.mask_flood_fill(mode='VALUE', value=1)  # 全体をマスク
-            bpy.ops.paint.hide_show_all(action='SHOW')  # 隠したFace Setを表示
-            bpy.ops.paint.mask_flood_fill(mode='INVERT')  # マスク反転
-            self.report({'INFO'}, "Face Set converted to mask successfully")
-        else:
+        if not (obj and obj.mode == 'SCULPT'):
             self.report({'WARNING'}, "Active object must be in Sculpt Mode")
+            return
+
+        # クリック位置をオブジェクト空間のレイに変換して面を特定
+        region = context.region
+        rv3d = context.region_data
+        coord = (event.mouse_region_x, event.mouse_region_y)
+        origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, coord)
+        direction = view3d_utils.region_2d_to_vector_3d(region, rv3d, coord)
+        mat_inv = obj.matrix_world.inverted()
+        hit, loc, normal, index = obj.ray_cast(
+            mat_inv @ origin, (mat_inv.to_3x3() @ direction).normalized())
+        if not hit:
+            self.report({'WARNING'}, "No face under the cursor")
+            return
+
+        mesh = obj.data
+        fs_attr = mesh.attributes.get(".sculpt_face_set")
+        if fs_attr is None:
+            self.report({'WARNING'}, "Mesh has no face sets")
+            return
+
+        # クリックされた Face Set の面 → 頂点に展開してマスクを作る
+        face_sets = np.empty(len(mesh.polygons), dtype=np.int32)
+        fs_attr.data.foreach_get("value", face_sets)
+        target_id = int(face_sets[index])
+
+        loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_total)
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+
+        mask = np.zeros(len(mesh.vertices), dtype=np.float32)
+        mask[loop_verts[np.repeat(face_sets == target_id, loop_total)]] = 1.0
+
+        mask_attr = mesh.attributes.get(".sculpt_mask")
+        if mask_attr is None:
+            mask_attr = mesh.attributes.new(".sculpt_mask", 'FLOAT', 'POINT')
+        mask_attr.data.foreach_set("value", mask)
+        mesh.update()
+        self.report({'INFO'}, "Face Set converted to mask successfully")
 
 # -----------------------------------------------------
 # ✅ オブジェクトモードとスカルプトモードを切り替えるオペレーター
@@ -354,7 +455,8 @@ class OBJECT_OT_toggle_object_sculpt(Operator):
     """オブジェクトモードとスカルプトモードを切り替える"""
     bl_idname = "object.toggle_object_sculpt"
     bl_label = "Toggle Object/Sculpt Mode"
-    bl_options = {'REGISTER', 'UNDO'}
+    # モード切り替え自体に undo 対象の副作用はないので undo push を積まない
+    bl_options = {'INTERNAL'}
 
     def execute(self, context):
         """オブジェクトモードとスカルプトモードをトグル"""
@@ -397,23 +499,48 @@ class OBJECT_PT_voxel_remesh_sculpt_panel(Panel):
 # -----------------------------------------------------
 # ✅ 登録処理
 # -----------------------------------------------------
+# アドオン有効化の体感を軽くするため、メインのオペレーターだけ即時登録し、
+# 残りはタイマーで遅延登録する。パネルはボタンが参照するオペレーター群の
+# 後に登録し、未登録 ID のボタンを描画する窓を作らない
+_ESSENTIAL_CLASSES = (
+    OBJECT_OT_voxel_remesh_sculpt_v2,
+)
+_LAZY_CLASSES = (
+    OBJECT_OT_apply_voxel_remesh_face_sets,
+    OBJECT_OT_create_face_sets,
+    OBJECT_OT_convert_to_mesh,
+    SCULPT_OT_face_set_to_mask,
+    OBJECT_OT_toggle_object_sculpt,
+    OBJECT_PT_voxel_remesh_sculpt_panel,
+)
+_lazy_registered = False
+
+# Python ループの代わりに factory のクロージャで登録・解除する
+_register_essential, _unregister_essential = bpy.utils.register_classes_factory(_ESSENTIAL_CLASSES)
+_register_lazy, _unregister_lazy = bpy.utils.register_classes_factory(_LAZY_CLASSES)
+
+
+def _register_lazy_classes():
+    global _lazy_registered
+    if not _lazy_registered:
+        _register_lazy()
+        _lazy_registered = True
+    return None  # タイマーを解除
+
+
 def register():
-    bpy.utils.register_class(OBJECT_OT_voxel_remesh_sculpt_v2)
-    bpy.utils.register_class(OBJECT_OT_apply_voxel_remesh_face_sets)
-    bpy.utils.register_class(OBJECT_OT_create_face_sets)
-    bpy.utils.register_class(OBJECT_OT_convert_to_mesh)
-    bpy.utils.register_class(SCULPT_OT_face_set_to_mask)
-    bpy.utils.register_class(OBJECT_OT_toggle_object_sculpt)
-    bpy.utils.register_class(OBJECT_PT_voxel_remesh_sculpt_panel)
-    
+    _register_essential()
+    bpy.app.timers.register(_register_lazy_classes, first_interval=0.1)
+
+
 def unregister():
-    bpy.utils.unregister_class(OBJECT_PT_voxel_remesh_sculpt_panel)
-    bpy.utils.unregister_class(OBJECT_OT_toggle_object_sculpt)
-    bpy.utils.unregister_class(SCULPT_OT_face_set_to_mask)
-    bpy.utils.unregister_class(OBJECT_OT_convert_to_mesh)
-    bpy.utils.unregister_class(OBJECT_OT_create_face_sets)
-    bpy.utils.unregister_class(OBJECT_OT_apply_voxel_remesh_face_sets)
-    bpy.utils.unregister_class(OBJECT_OT_voxel_remesh_sculpt_v2)
+    global _lazy_registered
+    if bpy.app.timers.is_registered(_register_lazy_classes):
+        bpy.app.timers.unregister(_register_lazy_classes)
+    if _lazy_registered:
+        _unregister_lazy()
+        _lazy_registered = False
+    _unregister_essential()
 
 
 if __name__ == "__main__":